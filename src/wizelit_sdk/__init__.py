@@ -1,11 +1,8 @@
 """Wizelit SDK package."""
 
-from wizelit_sdk.agent_wrapper import WizelitAgent
-from wizelit_sdk.database import DatabaseManager
-from wizelit_sdk.agent_wrapper.job import Job
-from wizelit_sdk.agent_wrapper.streaming import LogStreamer
-from wizelit_sdk.models.base import BaseModel
-from wizelit_sdk.models.job import JobModel, JobLogModel, JobStatus
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from wizelit_sdk.exceptions import (
     WizelitSDKException,
     AgentInitializationError,
@@ -21,6 +18,42 @@ from wizelit_sdk.exceptions import (
     TimeoutError,
 )
 
+if TYPE_CHECKING:
+    from wizelit_sdk.agent_wrapper import WizelitAgent
+    from wizelit_sdk.database import DatabaseManager
+    from wizelit_sdk.agent_wrapper.job import Job
+    from wizelit_sdk.agent_wrapper.streaming import LogStreamer
+    from wizelit_sdk.models.base import BaseModel
+    from wizelit_sdk.models.job import JobModel, JobLogModel, JobRow, JobStatus
+
+# Heavy submodules (fastmcp, SQLAlchemy, redis) are imported on first attribute
+# access (PEP 562) so that importing the package stays cheap.
+_LAZY_ATTRS = {
+    "WizelitAgent": "wizelit_sdk.agent_wrapper",
+    "DatabaseManager": "wizelit_sdk.database",
+    "Job": "wizelit_sdk.agent_wrapper.job",
+    "LogStreamer": "wizelit_sdk.agent_wrapper.streaming",
+    "BaseModel": "wizelit_sdk.models.base",
+    "JobModel": "wizelit_sdk.models.job",
+    "JobLogModel": "wizelit_sdk.models.job",
+    "JobRow": "wizelit_sdk.models.job",
+    "JobStatus": "wizelit_sdk.models.job",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
 __all__ = [
     "WizelitAgent",
     "DatabaseManager",
@@ -29,6 +62,7 @@ __all__ = [
     "BaseModel",
     "JobModel",
     "JobLogModel",
+    "JobRow",
     "JobStatus",
     # Exceptions
     "WizelitSDKException",
@@ -44,4 +78,3 @@ __all__ = [
     "TransportError",
     "TimeoutError",
 ]
-
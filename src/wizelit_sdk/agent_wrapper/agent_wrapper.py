@@ -1,16 +1,37 @@
 # wizelit_sdk/core.py
 import asyncio
+import contextlib
+import functools
 import inspect
+import itertools
 import logging
 import os
-from typing import Callable, Any, Optional, Literal, Dict, TYPE_CHECKING, Union, cast
+import types
+from collections import OrderedDict
+from typing import (
+    Annotated,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Any,
+    Optional,
+    Literal,
+    Mapping,
+    Dict,
+    List,
+    TYPE_CHECKING,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
 from contextvars import ContextVar
 from fastmcp import FastMCP, Context
 from fastmcp.dependencies import CurrentContext
-from wizelit_sdk.agent_wrapper.job import Job
+from wizelit_sdk.agent_wrapper.job import DatabaseLogWriter, Job, _job_models
 from wizelit_sdk.agent_wrapper.signature_validation import (
+    ArgumentBinder,
     SignatureValidationError,
-    bind_and_validate_arguments,
     ensure_type_hints,
 )
 from wizelit_sdk.exceptions import (
@@ -23,6 +44,8 @@ Transport = Literal["stdio", "http", "sse", "streamable-http"]
 if TYPE_CHECKING:
     from wizelit_sdk.database import DatabaseManager
 
+logger = logging.getLogger(__name__)
+
 # Reusable framework constants
 LLM_FRAMEWORK_CREWAI = "crewai"
 LLM_FRAMEWORK_LANGCHAIN = "langchain"
@@ -32,6 +55,66 @@ LlmFrameworkType = Literal["crewai", "langchain", "langraph", None]
 
 # Context variable for current Job instance
 _current_job: ContextVar[Optional[Job]] = ContextVar("_current_job", default=None)
+# Bound once; only tools that take a job (long-running or job-parameter tools)
+# go through _execute_tool and touch the ContextVar, the fast path never does
+_set_current_job = _current_job.set
+_reset_current_job = _current_job.reset
+
+# CurrentContext() is a stateless dependency marker, so one instance serves every
+# tool and the ctx default keeps a stable identity
+_CURRENT_CONTEXT_DEFAULT = CurrentContext()
+
+# Dependency-injected parameters appended to every tool signature.
+# inspect.Parameter is immutable, so all tools share the same instances.
+_CTX_PARAM = inspect.Parameter(
+    "ctx",
+    inspect.Parameter.KEYWORD_ONLY,
+    default=_CURRENT_CONTEXT_DEFAULT,
+    annotation=Context,
+)
+# Default for the injected job parameter; the wrapper resolves it to the current
+# Job with an identity check instead of isinstance(job, CurrentJob)
+_CURRENT_JOB_MARKER: Any = object()
+# Annotated as Any to avoid Pydantic issues
+_JOB_PARAM = inspect.Parameter(
+    "job",
+    inspect.Parameter.KEYWORD_ONLY,
+    default=_CURRENT_JOB_MARKER,
+    annotation=Any,
+)
+# Names excluded from validation/schema, with and without a job parameter
+_EXCLUDE_ARGS = ("ctx",)
+_EXCLUDE_ARGS_WITH_JOB = ("ctx", "job")
+
+
+def _make_invoker(func: Callable, is_async: bool) -> Callable[..., Awaitable[Any]]:
+    """
+    Return a callable that runs ``func`` with keyword arguments and returns an awaitable.
+    Sync functions are dispatched to a worker thread; resolved once per tool.
+    """
+    if is_async:
+        return func
+    return functools.partial(asyncio.to_thread, func)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """inspect.signature() memoized per function, preferring an explicit ``__signature__``."""
+    sig = getattr(func, "__signature__", None)
+    if isinstance(sig, inspect.Signature):
+        return sig
+    return inspect.signature(func)
+
+
+def _is_str_return(annotation: Any) -> bool:
+    """True if a return annotation is ``str`` or a union containing it (e.g. ``Optional[str]``)."""
+    if get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+    if annotation is str:
+        return True
+    return get_origin(annotation) in (Union, types.UnionType) and str in get_args(
+        annotation
+    )
 
 
 class CurrentJob:
@@ -51,6 +134,9 @@ class WizelitAgent:
     Built on top of fast-mcp with enhanced streaming and agent framework support.
     """
 
+    # Delay before job updates are written again after a failed flush
+    JOB_FLUSH_RETRY_SECONDS = 1.0
+
     def __init__(
         self,
         name: str,
@@ -60,6 +146,10 @@ class WizelitAgent:
         version: str = "1.0.0",
         db_manager: Optional["DatabaseManager"] = None,
         enable_streaming: bool = True,
+        log_batch_size: int = 100,
+        log_batch_timeout_ms: float = 10.0,
+        max_in_memory_jobs: int = 10_000,
+        job_flush_ms: float = 50.0,
     ):
         """
         Initialize the Wizelit Agent.
@@ -72,12 +162,29 @@ class WizelitAgent:
             version: Version string for the server
             db_manager: Optional DatabaseManager for job persistence
             enable_streaming: Enable real-time log streaming via Redis
+            log_batch_size: Number of log events published to Redis per pipelined batch
+            log_batch_timeout_ms: Maximum delay before a partial log batch is published
+            max_in_memory_jobs: Maximum number of jobs kept in memory; the oldest
+                finished jobs are evicted first (persisted jobs remain in the database)
+            job_flush_ms: Delay used to coalesce job updates made through set_job_status,
+                set_job_result and set_job_error into one database write
         """
-        self._mcp = FastMCP(name=name)
+        # Connections are opened lazily; the lifespan warms them up concurrently
+        # when the server starts instead of blocking construction
+        self._mcp = FastMCP(name=name, lifespan=self._lifespan)
         self._name = name
         self._version = version
         self._tools = {}
-        self._jobs: Dict[str, Job] = {}  # Store jobs by job_id
+        # Public per-tool metadata exposed (read-only) by list_tools()
+        self._tool_metadata: Dict[str, Dict[str, Any]] = {}
+        # Store jobs by job_id, oldest first, bounded by max_in_memory_jobs
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._max_in_memory_jobs = max_in_memory_jobs
+        # Jobs updated through the set_job_* methods and awaiting persistence;
+        # held here so they are written even if evicted from _jobs meanwhile
+        self._dirty_jobs: Dict[str, Job] = {}
+        self._job_flush_delay = job_flush_ms / 1000.0
+        self._job_flush_task: Optional[asyncio.Task] = None
         self._host = host
         self._transport: Transport = cast(Transport, transport)
         self._port = port
@@ -90,7 +197,11 @@ class WizelitAgent:
             try:
                 from .streaming import LogStreamer
 
-                self._log_streamer = LogStreamer(redis_url)
+                self._log_streamer = LogStreamer(
+                    redis_url,
+                    batch_size=log_batch_size,
+                    flush_ms=log_batch_timeout_ms,
+                )
                 print(f"Log streaming enabled via Redis: {redis_url}")
             except ImportError:
                 print("Warning: redis package not installed. Log streaming disabled.")
@@ -109,6 +220,7 @@ class WizelitAgent:
         is_long_running: bool = False,
         description: Optional[str] = None,
         response_handling: Optional[Dict[str, Any]] = None,
+        llm_framework: LlmFrameworkType = None,
     ):
         """
         Decorator to convert a function into an MCP tool.
@@ -116,6 +228,8 @@ class WizelitAgent:
         Args:
             is_long_running: If True, enables progress reporting
             description: Human-readable description of the tool
+            llm_framework: Optional agent framework the tool is built with
+                ("crewai", "langchain", "langraph"), reported by list_tools()
             response_handling: Optional dict configuring how tool responses are handled:
                 {
                     "mode": "direct" | "formatted" | "default",  # Default: "default"
@@ -161,15 +275,12 @@ class WizelitAgent:
             tool_name = func.__name__
             tool_description = description or func.__doc__ or f"Execute {tool_name}"
 
-            # Detect if function is async
+            # Detect if function is async and pick the dispatch strategy once
             is_async = inspect.iscoroutinefunction(func)
+            invoke = _make_invoker(func, is_async)
 
             # Get function signature
-            sig = inspect.signature(func)
-
-            # Build new signature with ctx: Context = CurrentContext() as LAST parameter
-            # This follows fast-mcp v2.14+ convention for dependency injection
-            params_list = list(sig.parameters.values())
+            sig = _cached_signature(func)
 
             # Check if function has 'job' parameter (for backward compatibility)
             has_job_param = sig.parameters.get("job") is not None
@@ -179,39 +290,32 @@ class WizelitAgent:
                     "is_long_running is True but 'job' parameter is not provided"
                 )
 
-            # Remove original 'job' parameter if it exists
+            # Build new signature with ctx: Context = CurrentContext() as LAST parameter
+            # (fast-mcp v2.14+ convention for dependency injection), followed by the
+            # injected job parameter replacing the original one if present
             if has_job_param:
-                params_list = [p for p in params_list if p.name != "job"]
-
-            # Add ctx as the last parameter with CurrentContext() as default
-            ctx_param = inspect.Parameter(
-                "ctx",
-                inspect.Parameter.KEYWORD_ONLY,
-                default=CurrentContext(),
-                annotation=Context,
-            )
-            params_list.append(ctx_param)
+                params = tuple(
+                    p for p in sig.parameters.values() if p.name != "job"
+                ) + (_CTX_PARAM, _JOB_PARAM)
+                exclude_args = _EXCLUDE_ARGS_WITH_JOB
+            else:
+                params = (*sig.parameters.values(), _CTX_PARAM)
+                exclude_args = _EXCLUDE_ARGS
 
-            # Add job parameter if function signature includes it
-            # Use None as default - we'll resolve CurrentJob() in the wrapper at call time
-            if has_job_param:
-                job_param = inspect.Parameter(
-                    "job",
-                    inspect.Parameter.KEYWORD_ONLY,
-                    default=None,
-                    annotation=Any,  # Use Any to avoid Pydantic issues
-                )
-                params_list.append(job_param)
+            new_sig = sig.replace(parameters=params)
 
-            new_sig = sig.replace(parameters=params_list)
+            # Validate that the user function has explicit type hints
+            type_hints = ensure_type_hints(func, exclude_params=exclude_args)
 
-            # Exclude dependency-injected params from validation/schema
-            exclude_args = ["ctx"]
-            if has_job_param:
-                exclude_args.append("job")
+            # Resolve binding/validation state once instead of per call
+            binder = ArgumentBinder(
+                func, exclude_params=exclude_args, type_hints=type_hints
+            )
 
-            # Validate that the user function has explicit type hints
-            ensure_type_hints(func, exclude_params=exclude_args)
+            # Check once whether a None result must be coerced to "" (str / Optional[str])
+            returns_str = _is_str_return(
+                type_hints.get("return", sig.return_annotation)
+            )
 
             # Validate response_handling schema early to catch drift
             if response_handling is not None:
@@ -234,7 +338,42 @@ class WizelitAgent:
                         f"response_handling.content_type for {tool_name} must be one of 'text', 'json', 'auto'"
                     )
 
-            # Create the wrapper function
+            # Pre-bind everything known at decoration time so each call only
+            # supplies the per-call context and arguments
+            bind = binder.bind
+            execute_fast = functools.partial(
+                self._execute_fast_tool,
+                invoke,
+                tool_name=tool_name,
+                returns_str=returns_str,
+            )
+            execute = functools.partial(
+                self._execute_tool,
+                invoke,
+                is_long_running=is_long_running,
+                tool_name=tool_name,
+                returns_str=returns_str,
+                has_job_param=has_job_param,
+            )
+
+            # Create the wrapper function.
+            # Tools without a job parameter that are not long-running never touch
+            # Job/CurrentJob state, so they get a leaner wrapper.
+            async def fast_tool_wrapper(*args, **kwargs):
+                """MCP-compliant wrapper for tools that need no Job."""
+                ctx = kwargs.pop("ctx", None)
+                if ctx is None:
+                    raise ValueError("Context not injected by fast-mcp")
+
+                try:
+                    func_kwargs = bind(args, kwargs)
+                except SignatureValidationError as exc:
+                    raise ValueError(
+                        f"Argument validation failed for {tool_name}: {exc}"
+                    ) from exc
+
+                return await execute_fast(ctx, kwargs=func_kwargs)
+
             async def tool_wrapper(*args, **kwargs):
                 """MCP-compliant wrapper with streaming."""
                 # Extract ctx from kwargs (injected by fast-mcp via CurrentContext())
@@ -242,28 +381,26 @@ class WizelitAgent:
                 if ctx is None:
                     raise ValueError("Context not injected by fast-mcp")
 
-                # Extract job from kwargs if present
-                # Handle case where fast-mcp might pass CurrentJob instance instead of Job
+                # Extract job from kwargs if present; the marker default
+                # resolves to the Job from the current context
                 job = None
                 if has_job_param:
                     job = kwargs.pop("job", None)
-                    # If job is a CurrentJob instance, call it to get the actual Job
-                    if isinstance(job, CurrentJob):
-                        job = job()
+                    if job is _CURRENT_JOB_MARKER:
+                        job = _current_job.get()
                     # If job is still None, _execute_tool will create it
 
                 try:
-                    func_kwargs = bind_and_validate_arguments(
-                        func, args, kwargs, exclude_params=exclude_args
-                    )
+                    func_kwargs = bind(args, kwargs)
                 except SignatureValidationError as exc:
                     raise ValueError(
                         f"Argument validation failed for {tool_name}: {exc}"
                     ) from exc
 
-                return await self._execute_tool(
-                    func, ctx, is_async, is_long_running, tool_name, job, **func_kwargs
-                )
+                return await execute(ctx, kwargs=func_kwargs, job=job)
+
+            if not is_long_running and not has_job_param:
+                tool_wrapper = fast_tool_wrapper
 
             # Set the signature with ctx as last parameter with CurrentContext() default
             cast(Any, tool_wrapper).__signature__ = new_sig
@@ -272,9 +409,7 @@ class WizelitAgent:
 
             # Copy annotations and add Context
             # Note: We don't add job annotation here since we use Any and exclude it from schema
-            new_annotations = {}
-            if hasattr(func, "__annotations__"):
-                new_annotations.update(func.__annotations__)
+            new_annotations = dict(getattr(func, "__annotations__", None) or {})
             new_annotations["ctx"] = Context
             if has_job_param:
                 new_annotations["job"] = (
@@ -287,7 +422,7 @@ class WizelitAgent:
             # Prepare tool kwargs
             tool_kwargs = {
                 "description": tool_description,
-                "exclude_args": exclude_args,
+                "exclude_args": list(exclude_args),
             }
 
             # Add response_handling metadata to tool's meta field (exposed via MCP protocol)
@@ -301,6 +436,12 @@ class WizelitAgent:
                 'function': func,
                 'wrapper': registered_tool,
                 'is_long_running': is_long_running,
+                'llm_framework': llm_framework,
+                'returns_str': returns_str,
+            }
+            self._tool_metadata[tool_name] = {
+                'is_long_running': is_long_running,
+                'llm_framework': llm_framework,
             }
 
             # Return original function so it can still be called directly
@@ -310,36 +451,40 @@ class WizelitAgent:
 
     async def _execute_tool(
         self,
-        func: Callable,
+        invoke: Callable[..., Awaitable[Any]],
         ctx: Context,
-        is_async: bool,
         is_long_running: bool,
         tool_name: str,
+        kwargs: Dict[str, Any],
         job: Optional[Job] = None,
-        **kwargs,
+        returns_str: bool = False,
+        has_job_param: bool = False,
     ) -> Any:
         """Central execution method for all tools."""
 
         token = None
+        startup: List[asyncio.Task] = []
         # Create Job instance if not provided
         if job is None and is_long_running:
             job = Job(ctx, db_manager=self._db_manager, log_streamer=self._log_streamer)
 
-            # Persist job to database BEFORE any logs are emitted
-            if self._db_manager:
-                await job.persist_to_db()
+            # Store job in jobs dictionary first so polling APIs see it immediately
+            self._remember_job(job)
 
-            # Store job in jobs dictionary for later retrieval
-            self._jobs[job.id] = job
+            # Persist the job and warm up the log stream concurrently with execution;
+            # the job's database log writes wait for the persist, so the row exists first
+            if self._db_manager:
+                startup.append(job.persist_in_background())
+            if self._log_streamer is not None and not self._log_streamer.is_connected:
+                startup.append(asyncio.create_task(self._log_streamer.connect()))
 
             # Set CurrentJob context so CurrentJob() can retrieve it
-            token = _current_job.set(job)
+            token = _set_current_job(job)
 
         try:
             try:
                 # Add job to kwargs if function signature includes it
-                func_sig = inspect.signature(func)
-                if "job" in func_sig.parameters:
+                if has_job_param:
                     # For non-long-running tools, create a minimal job if needed
                     if job is None and not is_long_running:
                         # Create a lightweight job for non-long-running tools that require it
@@ -352,34 +497,16 @@ class WizelitAgent:
                     if job is not None:
                         kwargs["job"] = job
 
-                # Execute function (async or sync)
-                logging.info(f"kwargs: {kwargs}")
-                if is_async:
-                    result = await func(**kwargs)
-                else:
-                    result = await asyncio.to_thread(func, **kwargs)
+                # Execute function (sync functions run in a worker thread)
+                logger.debug("kwargs: %s", kwargs)
+                result = await invoke(**kwargs)
 
                 # Ensure result is never None for functions that should return strings
-                func_sig = inspect.signature(func)
-                if result is None:
-                    return_annotation = func_sig.return_annotation
-                    # Check if return type is str (handle both direct str and Optional[str])
-                    is_str_return = (
-                        return_annotation is str
-                        or (
-                            hasattr(return_annotation, "__origin__")
-                            and return_annotation.__origin__ is str
-                        )
-                        or (
-                            hasattr(return_annotation, "__args__")
-                            and str in getattr(return_annotation, "__args__", [])
-                        )
+                if result is None and returns_str:
+                    logging.warning(
+                        f"Function {tool_name} returned None but should return str. Returning empty string."
                     )
-                    if is_str_return:
-                        logging.warning(
-                            f"Function {tool_name} returned None but should return str. Returning empty string."
-                        )
-                        result = ""
+                    result = ""
 
                 return result
 
@@ -397,7 +524,39 @@ class WizelitAgent:
         finally:
             # Reset CurrentJob context only if we set it
             if token is not None:
-                _current_job.reset(token)
+                _reset_current_job(token)
+            # Make sure the startup work (job record, stream connection) has finished
+            if startup:
+                await asyncio.gather(*startup, return_exceptions=True)
+            # Drain any buffered log events for this call
+            if self._log_streamer is not None:
+                await self._log_streamer.flush()
+
+    async def _execute_fast_tool(
+        self,
+        invoke: Callable[..., Awaitable[Any]],
+        ctx: Context,
+        tool_name: str,
+        kwargs: Dict[str, Any],
+        returns_str: bool,
+    ) -> Any:
+        """Execution path for tools that take no Job and are not long-running."""
+        try:
+            logger.debug("kwargs: %s", kwargs)
+            result = await invoke(**kwargs)
+        except Exception as e:
+            # Stream error information
+            await ctx.report_progress(
+                progress=0, message=f"Error in {tool_name}: {str(e)}"
+            )
+            raise
+
+        if result is None and returns_str:
+            logging.warning(
+                f"Function {tool_name} returned None but should return str. Returning empty string."
+            )
+            result = ""
+        return result
 
     def run(
         self,
@@ -431,15 +590,53 @@ class WizelitAgent:
         # Start the server
         self._mcp.run(transport=transport, host=host, port=port, **kwargs)
 
-    def list_tools(self) -> dict:
-        """Return metadata about all registered tools."""
-        return {
-            name: {
-                'is_long_running': info['is_long_running'],
-                'llm_framework': info['llm_framework']
-            }
-            for name, info in self._tools.items()
-        }
+    @contextlib.asynccontextmanager
+    async def _lifespan(self, server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Server lifespan: connect to Redis and the database concurrently on startup,
+        flush pending job updates and logs and close the log streamer on shutdown.
+        """
+        startup = []
+        if self._log_streamer is not None:
+            startup.append(self._log_streamer.connect())
+        if self._db_manager is not None:
+            startup.append(self._db_manager.health_check())
+        if startup:
+            await asyncio.gather(*startup, return_exceptions=True)
+
+        try:
+            yield {}
+        finally:
+            await self.flush_job_updates()
+            if self._db_manager is not None:
+                await DatabaseLogWriter.for_manager(self._db_manager).flush()
+            if self._log_streamer is not None:
+                await self._log_streamer.close()
+
+    def list_tools(self) -> Mapping[str, Dict[str, Any]]:
+        """Return a read-only view of metadata about all registered tools."""
+        return types.MappingProxyType(self._tool_metadata)
+
+    def _remember_job(self, job: Job) -> None:
+        """Track a job in memory, evicting the oldest finished jobs beyond the limit."""
+        self._jobs[job.id] = job
+        overflow = len(self._jobs) - self._max_in_memory_jobs
+        if overflow <= 0:
+            return
+        # Running jobs are never evicted, so the cache may briefly exceed the limit;
+        # the scan stops at the first ``overflow`` finished jobs
+        evictable = list(
+            itertools.islice(
+                (
+                    job_id
+                    for job_id, cached in self._jobs.items()
+                    if cached.status != "running"
+                ),
+                overflow,
+            )
+        )
+        for job_id in evictable:
+            del self._jobs[job_id]
 
     def get_job_logs(self, job_id: str) -> Optional[list]:
         """
@@ -506,34 +703,31 @@ class WizelitAgent:
             return None
 
         try:
-            from wizelit_sdk.models.job import JobModel
-            from sqlalchemy import select
+            JobModel, _ = _job_models()
 
             async with self._db_manager.get_session() as session:
-                result = await session.execute(
-                    select(JobModel).where(JobModel.id == job_id)
-                )
-                job_model = result.scalar_one_or_none()
-
-                if not job_model:
-                    return None
-
-                return {
-                    "id": job_model.id,
-                    "status": job_model.status,
-                    "result": job_model.result,
-                    "error": job_model.error,
-                    "created_at": (
-                        job_model.created_at.isoformat()
-                        if job_model.created_at is not None
-                        else None
-                    ),
-                    "updated_at": (
-                        job_model.updated_at.isoformat()
-                        if job_model.updated_at is not None
-                        else None
-                    ),
-                }
+                rows = await JobModel.fetch_rows(session, (job_id,))
+
+            if not rows:
+                return None
+            job_row = rows[0]
+
+            return {
+                "id": job_row.id,
+                "status": job_row.status,
+                "result": job_row.result,
+                "error": job_row.error,
+                "created_at": (
+                    job_row.created_at.isoformat()
+                    if job_row.created_at is not None
+                    else None
+                ),
+                "updated_at": (
+                    job_row.updated_at.isoformat()
+                    if job_row.updated_at is not None
+                    else None
+                ),
+            }
         except Exception as e:
             logging.error(f"Error retrieving job from database: {e}")
             return None
@@ -555,22 +749,16 @@ class WizelitAgent:
             return None
 
         try:
-            from wizelit_sdk.models.job import JobLogModel
-            from sqlalchemy import select
+            _, JobLogModel = _job_models()
 
             async with self._db_manager.get_session() as session:
-                result = await session.execute(
-                    select(JobLogModel)
-                    .where(JobLogModel.job_id == job_id)
-                    .order_by(JobLogModel.timestamp.asc())
-                    .limit(limit)
-                )
-                log_models = result.scalars().all()
+                entries = await JobLogModel.fetch_entries(session, job_id, limit)
 
-                return [
-                    f"[{log.level}] [{log.timestamp.strftime('%H:%M:%S')}] {log.message}"
-                    for log in log_models
-                ]
+            # Integer formatting is much cheaper than strftime per row
+            return [
+                f"[{level}] [{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}] {message}"
+                for level, ts, message in entries
+            ]
         except Exception as e:
             logging.error(f"Error retrieving logs from database: {e}")
             return None
@@ -599,6 +787,7 @@ class WizelitAgent:
         if job is None:
             return False
         job.status = status
+        self._mark_job_dirty(job)
         return True
 
     def set_job_result(
@@ -618,6 +807,7 @@ class WizelitAgent:
         if job is None:
             return False
         job.result = result
+        self._mark_job_dirty(job)
         return True
 
     def set_job_error(self, job_id: str, error: Optional[str]) -> bool:
@@ -635,4 +825,48 @@ class WizelitAgent:
         if job is None:
             return False
         job.error = error
+        self._mark_job_dirty(job)
         return True
+
+    def _mark_job_dirty(self, job: Job) -> None:
+        """Queue a job for persistence and schedule a coalesced flush."""
+        if not self._db_manager:
+            return
+        self._dirty_jobs[job.id] = job
+        self._schedule_job_flush(self._job_flush_delay)
+
+    def _schedule_job_flush(self, delay: float) -> None:
+        """Start a flush after ``delay`` seconds unless one is already pending."""
+        task = self._job_flush_task
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop - the update is written by the next flush
+            return
+        self._job_flush_task = loop.create_task(self._flush_jobs_after_delay(delay))
+
+    async def _flush_jobs_after_delay(self, delay: float) -> None:
+        """Wait briefly so bursts of updates share one write, then flush."""
+        await asyncio.sleep(delay)
+        await self.flush_job_updates()
+
+    async def flush_job_updates(self) -> None:
+        """
+        Persist all jobs updated through the set_job_* methods in one upsert.
+        Errors are logged and do not raise; the jobs are kept and written again
+        after ``JOB_FLUSH_RETRY_SECONDS``.
+        """
+        if not self._db_manager or not self._dirty_jobs:
+            return
+
+        dirty, self._dirty_jobs = self._dirty_jobs, {}
+        try:
+            # Goes through each job's persist lock and last-persisted state
+            await Job.persist_many(dirty.values(), self._db_manager)
+        except Exception as e:
+            logging.error(f"Error persisting job updates to database: {e}")
+            for job_id, job in dirty.items():
+                self._dirty_jobs.setdefault(job_id, job)
+            self._schedule_job_flush(self.JOB_FLUSH_RETRY_SECONDS)
@@ -3,36 +3,74 @@ Job class for managing execution context and logging in Wizelit Agent Wrapper.
 """
 import logging
 import asyncio
+import contextlib
+import functools
 import uuid
+import threading
 import time
+import weakref
+from collections import deque
 from datetime import datetime, UTC
-from typing import Optional, Awaitable, Any, TYPE_CHECKING
+from typing import Optional, Awaitable, Any, Callable, Deque, Iterable, TYPE_CHECKING
 from fastmcp import Context
 
 if TYPE_CHECKING:
     from ..database import DatabaseManager
     from .streaming import LogStreamer
 
+logger = logging.getLogger(__name__)
+
+
+@functools.cache
+def _job_models() -> tuple[type, type]:
+    """
+    Return (JobModel, JobLogModel), importing them on first use.
+    Imported lazily to avoid a circular dependency and keep SQLAlchemy off the import path.
+    """
+    from ..models.job import JobModel, JobLogModel
+
+    return JobModel, JobLogModel
+
+
+class _SecondClock:
+    """
+    Formats a record's creation time as HH:MM:SS.
+
+    Keeps the (second, string) of the last call so records within the same second
+    reuse the string instead of calling strftime again.
+    """
+
+    __slots__ = ("_cache",)
+
+    def __init__(self) -> None:
+        self._cache: tuple[int, str] = (-1, "")
+
+    def __call__(self, created: float) -> str:
+        sec = int(created)
+        cached_sec, ts = self._cache
+        if sec != cached_sec:
+            ts = time.strftime("%H:%M:%S", time.localtime(sec))
+            self._cache = (sec, ts)
+        return ts
+
 
 class MemoryLogHandler(logging.Handler):
     """
-    Custom logging handler that stores log messages in a list.
+    Custom logging handler that stores log messages in a list or bounded deque.
     """
 
-    def __init__(self, logs_list: list[str]):
+    def __init__(self, logs_list: list[str] | Deque[str]):
         super().__init__()
         self.logs_list = logs_list
-        self.setFormatter(logging.Formatter('%(message)s'))
+        self._clock = _SecondClock()
 
     def emit(self, record: logging.LogRecord) -> None:
         """
         Emit a log record by appending it to the logs list.
         """
         try:
-            # Format timestamp
-            ts = time.strftime("%H:%M:%S")
-
             # Format message with level and timestamp
+            ts = self._clock(record.created)
             formatted_message = f"[{record.levelname}] [{ts}] {record.getMessage()}"
 
             # Append to logs list
@@ -42,94 +80,273 @@ class MemoryLogHandler(logging.Handler):
             self.handleError(record)
 
 
-class DatabaseLogHandler(logging.Handler):
+class DatabaseLogWriter:
     """
-    Logging handler that persists log messages to PostgreSQL database.
-    Writes asynchronously to avoid blocking the logging thread.
+    Background writer that batches job log rows into few database writes.
+
+    Handlers enqueue rows without awaiting; a single task per DatabaseManager
+    waits ``flush_ms`` after the first queued row, then writes up to
+    ``batch_size`` rows with one bulk insert and one commit.
     """
 
-    def __init__(self, job_id: str, db_manager: 'DatabaseManager'):
-        super().__init__()
-        self.job_id = job_id
-        self.db_manager = db_manager
-        self.setFormatter(logging.Formatter('%(message)s'))
+    _writers: "weakref.WeakKeyDictionary[DatabaseManager, DatabaseLogWriter]" = (
+        weakref.WeakKeyDictionary()
+    )
 
-    def emit(self, record: logging.LogRecord) -> None:
+    def __init__(
+        self,
+        db_manager: 'DatabaseManager',
+        batch_size: int = 500,
+        flush_ms: float = 50.0,
+    ):
+        """
+        Args:
+            db_manager: DatabaseManager used to open write sessions
+            batch_size: Maximum rows written per batch
+            flush_ms: Delay after the first queued row before a batch is written
         """
-        Emit a log record by writing it to the database asynchronously.
+        self.db_manager = db_manager
+        self.batch_size = max(1, batch_size)
+        self.flush_ms = flush_ms
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def for_manager(cls, db_manager: 'DatabaseManager') -> 'DatabaseLogWriter':
+        """Return the shared writer for a DatabaseManager, creating it on first use."""
+        writer = cls._writers.get(db_manager)
+        if writer is None:
+            writer = cls._writers[db_manager] = cls(db_manager)
+        return writer
+
+    def submit(
+        self,
+        row: dict[str, Any],
+        wait_ready: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> None:
         """
+        Queue a log row for writing. Must be called from the running event loop.
+
+        Args:
+            row: JobLogModel column values (job_id, message, level, timestamp)
+            wait_ready: Awaited before the row is written (e.g. job persistence)
+        """
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._task = loop.create_task(self._run())
+        self._queue.put_nowait((wait_ready, row))
+
+    async def flush(self) -> None:
+        """Wait until every queued row has been written."""
+        if self._task is not None and not self._task.done():
+            await self._queue.join()
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            # Give concurrent log lines a moment to join this batch
+            await asyncio.sleep(self.flush_ms / 1000)
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _write(self, batch: list[tuple[Any, dict[str, Any]]]) -> None:
+        rows = [row for _, row in batch]
         try:
-            # Import here to avoid circular dependency
-            from ..models.job import JobLogModel
-            from datetime import datetime
+            # Log rows must never precede their job row
+            waiters = {wait_ready for wait_ready, _ in batch if wait_ready is not None}
+            if waiters:
+                await asyncio.gather(*(wait_ready() for wait_ready in waiters))
 
-            async def write_log():
-                try:
-                    async with self.db_manager.get_session() as session:
-                        log = JobLogModel(
-                            job_id=self.job_id,
-                            message=record.getMessage(),
-                            level=record.levelname,
-                            timestamp=datetime.now(UTC).replace(tzinfo=None)
-                        )
-                        session.add(log)
-                        await session.commit()
-                except Exception as e:
-                    # Log to stderr but don't break execution
-                    print(f"Error writing log to database: {e}", flush=True)
+            await self._write_rows(rows)
+            return
+        except Exception as e:
+            error = e
+
+        by_job: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            by_job.setdefault(row["job_id"], []).append(row)
+        if len(by_job) == 1:
+            # Log to stderr but don't break execution
+            print(f"Error writing {len(rows)} log(s) to database: {error}", flush=True)
+            return
 
-            # Schedule async write without awaiting
+        # One job's failing rows (e.g. its job row was never written) must not
+        # cost the other jobs in the batch their logs
+        for job_id, job_rows in by_job.items():
             try:
-                loop = asyncio.get_running_loop()
-                loop.create_task(write_log())
-            except RuntimeError:
-                # No event loop running - log warning
-                print("Warning: No event loop running, cannot write log to database", flush=True)
-        except Exception:
-            # Prevent exceptions in logging handler from breaking execution
-            self.handleError(record)
+                await self._write_rows(job_rows)
+            except Exception as e:
+                print(
+                    f"Error writing {len(job_rows)} log(s) for job {job_id} to database: {e}",
+                    flush=True,
+                )
+
+    async def _write_rows(self, rows: list[dict[str, Any]]) -> None:
+        """Write log rows in one session (COPY for large batches, else executemany)."""
+        _, JobLogModel = _job_models()
+        async with self.db_manager.get_session() as session:
+            await JobLogModel.bulk_write(session, rows)
 
 
-class StreamingLogHandler(logging.Handler):
+def _loop_of_caller() -> tuple[Optional[asyncio.AbstractEventLoop], Optional[int]]:
+    """Return the running event loop and its thread id, or (None, None) outside a loop."""
+    try:
+        return asyncio.get_running_loop(), threading.get_ident()
+    except RuntimeError:
+        return None, None
+
+
+class _LoopBoundHandler(logging.Handler):
     """
-    Logging handler that publishes log messages to Redis for real-time streaming.
-    Enables push-based log delivery without polling.
+    Base for handlers that hand records to asyncio-side consumers.
+
+    The running event loop is captured once at construction (handlers are built
+    by Job on the loop); records logged on the loop thread are dispatched directly
+    and records from other threads (e.g. sync tools running via asyncio.to_thread)
+    go through call_soon_threadsafe.
     """
 
-    def __init__(self, job_id: str, log_streamer: 'LogStreamer'):
+    #: Printed when a record arrives and no event loop is available
+    no_loop_warning = "Warning: No event loop running, cannot dispatch log"
+
+    def __init__(self):
+        super().__init__()
+        self._loop, self._loop_thread = _loop_of_caller()
+
+    def _dispatch(self, func: Callable[..., None], *args: Any) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            # No event loop running - log warning
+            print(self.no_loop_warning, flush=True)
+        elif threading.get_ident() == self._loop_thread:
+            func(*args)
+        else:
+            loop.call_soon_threadsafe(func, *args)
+
+
+class FanoutLogHandler(_LoopBoundHandler):
+    """
+    Single job handler that fans each record out to every log destination.
+
+    Keeps the in-memory log, queues rows for the DatabaseLogWriter and buffers
+    events on the LogStreamer in one emit(): the message is rendered once, one
+    handler lock is taken, and the database and Redis consumers share a single
+    hand-off to the event loop.
+    """
+
+    no_loop_warning = "Warning: No event loop running, cannot write log to database or Redis"
+
+    def __init__(
+        self,
+        job_id: str,
+        logs_list: list[str] | Deque[str],
+        db_manager: Optional['DatabaseManager'] = None,
+        wait_ready: Optional[Callable[[], Awaitable[None]]] = None,
+        log_streamer: Optional['LogStreamer'] = None,
+    ):
         super().__init__()
         self.job_id = job_id
+        self.logs_list = logs_list
+        self.writer = DatabaseLogWriter.for_manager(db_manager) if db_manager else None
+        # Awaited before each database write so log rows never precede the job row
+        self.wait_ready = wait_ready
         self.log_streamer = log_streamer
-        self.setFormatter(logging.Formatter('%(message)s'))
+        self._clock = _SecondClock()
 
     def emit(self, record: logging.LogRecord) -> None:
         """
-        Emit a log record by publishing it to Redis Pub/Sub.
+        Emit a log record to memory, and queue it for the database and Redis.
         """
         try:
-            async def publish_log():
-                try:
-                    await self.log_streamer.publish_log(
-                        self.job_id,
-                        record.getMessage(),
-                        record.levelname
-                    )
-                except Exception as e:
-                    # Log to stderr but don't break execution
-                    print(f"Error streaming log: {e}", flush=True)
+            message = record.getMessage()
+            level = record.levelname
+            self.logs_list.append(f"[{level}] [{self._clock(record.created)}] {message}")
 
-            # Schedule async publish without awaiting
-            try:
-                loop = asyncio.get_running_loop()
-                loop.create_task(publish_log())
-            except RuntimeError:
-                # No event loop running - log warning
-                print("Warning: No event loop running, cannot stream log to Redis", flush=True)
-        except Exception as e:
+            if self.writer is not None or self.log_streamer is not None:
+                self._dispatch(self._deliver, message, level, record.created)
+        except Exception:
             # Prevent exceptions in logging handler from breaking execution
-            print(f"Error in StreamingLogHandler.emit: {e}", flush=True)
             self.handleError(record)
 
+    def _deliver(self, message: str, level: str, created: float) -> None:
+        """Hand a record to the database writer and the streamer (on the event loop)."""
+        if self.writer is not None:
+            row = {
+                "job_id": self.job_id,
+                "message": message,
+                "level": level,
+                "timestamp": datetime.fromtimestamp(created, UTC).replace(tzinfo=None),
+            }
+            self.writer.submit(row, self.wait_ready)
+        if self.log_streamer is not None:
+            self.log_streamer.enqueue_log(self.job_id, message, level)
+
+
+class _HeartbeatScheduler:
+    """
+    Emits heartbeats for every running job on one event loop from a single task.
+
+    Jobs register while they run; each tick updates their in-memory heartbeat
+    line and sends the elapsed times to each streamer in one pipelined
+    round-trip. The task exits once no jobs are left and is restarted on demand.
+    """
+
+    _schedulers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[float, _HeartbeatScheduler]]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self, interval_seconds: float):
+        self._interval = interval_seconds
+        self._jobs: "weakref.WeakSet[Job]" = weakref.WeakSet()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @classmethod
+    def for_interval(cls, interval_seconds: float) -> "_HeartbeatScheduler":
+        """Return the scheduler for this interval on the running loop."""
+        per_loop = cls._schedulers.setdefault(asyncio.get_running_loop(), {})
+        scheduler = per_loop.get(interval_seconds)
+        if scheduler is None:
+            scheduler = per_loop[interval_seconds] = cls(interval_seconds)
+        return scheduler
+
+    def add(self, job: "Job") -> None:
+        self._jobs.add(job)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def discard(self, job: "Job") -> None:
+        self._jobs.discard(job)
+
+    async def _run(self) -> None:
+        while self._jobs:
+            await asyncio.sleep(self._interval)
+            batches: dict[Any, dict[str, int]] = {}
+            for job in list(self._jobs):
+                if job._status != "running":
+                    continue
+                try:
+                    elapsed = job._record_heartbeat()
+                except Exception as e:
+                    # One job's failure must not stop heartbeats for the others
+                    logger.error("Failed to record heartbeat for job %s: %s", job._id, e)
+                    continue
+                if job._log_streamer is not None:
+                    batches.setdefault(job._log_streamer, {})[job._id] = elapsed
+            if batches:
+                await asyncio.gather(
+                    *(streamer.publish_heartbeats(beats) for streamer, beats in batches.items()),
+                    return_exceptions=True,
+                )
+
 
 class Job:
     """
@@ -142,7 +359,8 @@ class Job:
         ctx: Context,
         job_id: Optional[str] = None,
         db_manager: Optional['DatabaseManager'] = None,
-        log_streamer: Optional['LogStreamer'] = None
+        log_streamer: Optional['LogStreamer'] = None,
+        max_memory_logs: int = 10_000,
     ):
         """
         Initialize a Job instance.
@@ -152,15 +370,23 @@ class Job:
             job_id: Optional job identifier (generates UUID if not provided)
             db_manager: Optional DatabaseManager for persisting logs
             log_streamer: Optional LogStreamer for real-time log streaming
+            max_memory_logs: Number of most recent log lines kept in memory
         """
         self._ctx = ctx
         self._id = job_id or f"JOB-{str(uuid.uuid4())[:8]}"
         self._status = "running"
-        self._logs: list[str] = []
+        # Ring buffer: appends are O(1) and the oldest lines are evicted
+        self._logs: Deque[str] = deque(maxlen=max_memory_logs)
         self._result: Optional[str] = None
         self._error: Optional[str] = None
         self._db_manager = db_manager
         self._log_streamer = log_streamer
+        self._persist_lock = asyncio.Lock()
+        self._persist_task: Optional["asyncio.Task[None]"] = None
+        # (status, result, error) last written to the database
+        self._last_persisted: Optional[tuple[Any, ...]] = None
+        self._started_at = time.monotonic()
+        self._heartbeat_line: Optional[str] = None
 
         # Set up logger
         self._setup_logger(ctx)
@@ -177,8 +403,8 @@ class Job:
 
     @property
     def logs(self) -> list[str]:
-        """List of log messages (timestamped strings)."""
-        return self._logs
+        """List of the most recent log messages (timestamped strings), as a snapshot."""
+        return list(self._logs)
 
     @property
     def status(self) -> str:
@@ -187,11 +413,13 @@ class Job:
 
     @status.setter
     def status(self, value: str) -> None:
-        """Set job status and publish status change event."""
+        """Set job status and publish status change event (no-op if unchanged)."""
+        if value == self._status:
+            return
         self._status = value
         # Publish status change to Redis if streamer is available
         if self._log_streamer:
-            print(f"[DEBUG] Publishing status change for job {self._id}: {value}", flush=True)
+            logger.debug("Publishing status change for job %s: %s", self._id, value)
             async def publish_status():
                 try:
                     await self._log_streamer.publish_status_change(
@@ -200,7 +428,7 @@ class Job:
                         result=self._result,
                         error=self._error
                     )
-                    print(f"[DEBUG] Status change published successfully for job {self._id}", flush=True)
+                    logger.debug("Status change published successfully for job %s", self._id)
                 except Exception as e:
                     print(f"Error publishing status change: {e}", flush=True)
 
@@ -210,7 +438,7 @@ class Job:
             except RuntimeError:
                 print("Warning: No event loop running, cannot publish status change to Redis", flush=True)
         else:
-            print(f"[DEBUG] No log_streamer available for job {self._id}, skipping Redis publish", flush=True)
+            logger.debug("No log_streamer available for job %s, skipping Redis publish", self._id)
 
     @property
     def result(self) -> Optional[str | dict[str, Any]]:
@@ -232,20 +460,23 @@ class Job:
         """Set job error message."""
         self._error = value
 
-    async def _heartbeat(self, interval_seconds: float = 5.0) -> None:
+    def _record_heartbeat(self) -> int:
         """
-        Periodically append a heartbeat log while a job is running so the UI
-        has visible progress even during long operations.
+        Update the in-memory heartbeat line and return the elapsed seconds.
+
+        Heartbeats bypass the log handlers: the in-memory log keeps a single
+        heartbeat line that is updated in place, and the scheduler sets a
+        short-lived Redis key through the streamer. Nothing is written to the
+        database.
         """
-        start = time.monotonic()
-        while self._status == "running":
-            await asyncio.sleep(interval_seconds)
-            # Re-check in case status changed while sleeping
-            if self._status != "running":
-                break
-            elapsed = int(time.monotonic() - start)
-            # Use logger so logs are captured in memory and streamed if enabled
-            self.logger.info(f"⏳ Still working... ({elapsed}s)")
+        elapsed = int(time.monotonic() - self._started_at)
+        line = f"[INFO] [{time.strftime('%H:%M:%S')}] ⏳ Still working... ({elapsed}s)"
+        if self._heartbeat_line is not None and self._logs and self._logs[-1] is self._heartbeat_line:
+            self._logs[-1] = line
+        else:
+            self._logs.append(line)
+        self._heartbeat_line = line
+        return elapsed
 
     def run(
         self,
@@ -258,19 +489,19 @@ class Job:
 
         This is intended for long-running jobs. It:
         - Marks the job as running
-        - Starts a heartbeat logger
+        - Registers the job with the shared heartbeat scheduler
         - Awaits the provided coroutine
         - On success: stores the result (if string) and marks status 'completed'
         - On failure: stores the error message and marks status 'failed'
         """
-        import asyncio
-
         async def _runner() -> Any:
             self.status = "running"
             # Persist initial job state
             await self.persist_to_db()
 
-            heartbeat_task = asyncio.create_task(self._heartbeat(heartbeat_interval))
+            self._started_at = time.monotonic()
+            heartbeats = _HeartbeatScheduler.for_interval(heartbeat_interval)
+            heartbeats.add(self)
             try:
                 result = await coro
                 # Store string results for convenience
@@ -281,7 +512,7 @@ class Job:
                     # Persist completion state
                     await self.persist_to_db()
                 return result
-            except Exception as e:  # noqa: BLE001 - we deliberately capture all
+            except Exception as e:  # we deliberately capture all
                 self.error = str(e)
                 self.status = "failed"
                 # Persist failure state
@@ -290,16 +521,7 @@ class Job:
                 self.logger.error(f"❌ [System] Error: {e}")
                 raise
             finally:
-                # Stop heartbeat
-                heartbeat_task.cancel()
-                try:
-                    import contextlib
-
-                    with contextlib.suppress(asyncio.CancelledError):
-                        await heartbeat_task
-                except Exception:
-                    # Ignore heartbeat shutdown errors
-                    pass
+                heartbeats.discard(self)
 
         # Schedule the runner in the current event loop and return the Task
         return asyncio.create_task(_runner())
@@ -322,26 +544,37 @@ class Job:
         # Remove any existing handlers to avoid duplicates
         self._logger.handlers.clear()
 
-        # Add MemoryLogHandler for internal storage (backward compatibility)
-        memory_handler = MemoryLogHandler(self._logs)
-        memory_handler.setLevel(logging.INFO)
-        self._logger.addHandler(memory_handler)
-
-        # Add DatabaseLogHandler if db_manager provided
-        if self._db_manager:
-            db_handler = DatabaseLogHandler(self._id, self._db_manager)
-            db_handler.setLevel(logging.INFO)
-            self._logger.addHandler(db_handler)
-
-        # Add StreamingLogHandler if log_streamer provided
-        if self._log_streamer:
-            streaming_handler = StreamingLogHandler(self._id, self._log_streamer)
-            streaming_handler.setLevel(logging.INFO)
-            self._logger.addHandler(streaming_handler)
+        # One handler fans each record out to memory, the database and Redis
+        self._logger.addHandler(
+            FanoutLogHandler(
+                self._id,
+                self._logs,
+                db_manager=self._db_manager,
+                wait_ready=self._wait_persisted,
+                log_streamer=self._log_streamer,
+            )
+        )
 
         # Prevent propagation to root logger
         self._logger.propagate = False
 
+    def persist_in_background(self) -> "asyncio.Task[None]":
+        """
+        Start persisting the job state without waiting for the database write.
+        Database log writes for this job wait for it, so the job row exists first.
+
+        Returns:
+            The task running persist_to_db(); await it before relying on the row
+        """
+        self._persist_task = asyncio.create_task(self.persist_to_db())
+        return self._persist_task
+
+    async def _wait_persisted(self) -> None:
+        """Wait for a pending background persist, if any."""
+        task = self._persist_task
+        if task is not None and not task.done():
+            await asyncio.shield(task)
+
     async def persist_to_db(self) -> None:
         """
         Persist the job state to the database.
@@ -350,30 +583,92 @@ class Job:
         if not self._db_manager:
             return
 
+        # Serialize writes so an older state can never overwrite a newer one
+        async with self._persist_lock:
+            state = self._state_snapshot()
+            # Skip the round-trip when nothing changed since the last write
+            if state == self._last_persisted:
+                return
+            if await self._write_to_db():
+                self._last_persisted = state
+
+    @staticmethod
+    async def persist_many(jobs: Iterable["Job"], db_manager: "DatabaseManager") -> None:
+        """
+        Persist several jobs in one upsert.
+
+        Holds every job's persist lock for the write, so it never interleaves
+        with persist_to_db, skips jobs whose state is unchanged, and records the
+        written state on each job. Errors are raised to the caller.
+
+        Args:
+            jobs: Jobs to persist
+            db_manager: DatabaseManager to write through
+        """
+        # Locks are taken in id order so concurrent callers cannot deadlock
+        ordered = sorted({job._id: job for job in jobs}.values(), key=lambda job: job._id)
+        async with contextlib.AsyncExitStack() as stack:
+            for job in ordered:
+                await stack.enter_async_context(job._persist_lock)
+
+            pending = [(job, job._state_snapshot()) for job in ordered]
+            pending = [(job, state) for job, state in pending if state != job._last_persisted]
+            if not pending:
+                return
+
+            JobModel, _ = _job_models()
+            async with db_manager.get_session() as session:
+                await JobModel.bulk_upsert(
+                    session,
+                    [
+                        {
+                            "id": job._id,
+                            "status": job._status,
+                            "result": job._result,
+                            "error": job._error,
+                        }
+                        for job, _ in pending
+                    ],
+                )
+            for job, state in pending:
+                job._last_persisted = state
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """(status, result, error) as compared against the last persisted state."""
+        return (
+            self._status,
+            dict(self._result) if isinstance(self._result, dict) else self._result,
+            self._error,
+        )
+
+    async def _write_to_db(self) -> bool:
+        """
+        Create or update the job record (callers hold the persist lock).
+
+        Returns:
+            True if the write succeeded
+        """
+        if not self._db_manager:
+            return False
+
         try:
-            from ..models.job import JobModel
+            JobModel, _ = _job_models()
 
+            # Single INSERT ... ON CONFLICT DO UPDATE; no SELECT to decide insert vs update
             async with self._db_manager.get_session() as session:
-                # Check if job already exists
-                existing_job = await session.get(JobModel, self._id)
-
-                if existing_job:
-                    # Update existing job
-                    existing_job.status = self._status
-                    existing_job.result = self._result
-                    existing_job.error = self._error
-                    existing_job.updated_at = datetime.now(UTC).replace(tzinfo=None)
-                else:
-                    # Create new job
-                    job = JobModel(
-                        id=self._id,
-                        status=self._status,
-                        result=self._result,
-                        error=self._error
-                    )
-                    session.add(job)
-
-                await session.commit()
+                await JobModel.bulk_upsert(
+                    session,
+                    [
+                        {
+                            "id": self._id,
+                            "status": self._status,
+                            "result": self._result,
+                            "error": self._error,
+                        }
+                    ],
+                )
+            return True
         except Exception as e:
             # Log error but don't break execution
             print(f"Error persisting job to database: {e}", flush=True)
+            return False
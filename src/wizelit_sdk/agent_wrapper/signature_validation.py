@@ -7,10 +7,24 @@ expected signature at runtime.
 
 from __future__ import annotations
 
+import functools
 import inspect
-from typing import Any, Dict, Iterable, Mapping, Sequence, get_type_hints
+import types
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    Sequence,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+    is_typeddict,
+)
 
-from typeguard import check_type
+from typeguard import TypeCheckError, check_type
 
 
 class SignatureValidationError(TypeError):
@@ -21,6 +35,69 @@ def _clean_excluded(exclude: Iterable[str] | None) -> set[str]:
     return {name for name in (exclude or [])}
 
 
+# Implicit numeric promotions typeguard accepts (PEP 484 numeric tower)
+_NUMERIC_PROMOTIONS: Dict[type, tuple[type, ...]] = {
+    float: (float, int),
+    complex: (complex, float, int),
+}
+
+
+def _plain_class(hint: Any) -> bool:
+    """True if ``isinstance(value, hint)`` is a complete check for ``hint``."""
+    return (
+        isinstance(hint, type)
+        and get_origin(hint) is None
+        and not getattr(hint, "_is_protocol", False)
+        and not is_typeddict(hint)
+    )
+
+
+def _compile_check(hint: Any) -> Callable[[Any], bool] | None:
+    """Build a predicate that accepts the values ``check_type(value, hint)`` accepts.
+
+    Plain classes and ``Optional`` of a plain class become ``isinstance`` tests;
+    every other hint falls back to typeguard. Returns None when any value is
+    accepted (``Any``), so no check is needed.
+    """
+    if hint is Any:
+        return None
+
+    if _plain_class(hint):
+        classes = _NUMERIC_PROMOTIONS.get(hint, (hint,))
+        return lambda value: isinstance(value, classes)
+
+    if get_origin(hint) in (Union, types.UnionType):
+        members = [arg for arg in get_args(hint) if arg is not type(None)]
+        if len(members) == 1 and _plain_class(members[0]):
+            classes = _NUMERIC_PROMOTIONS.get(members[0], (members[0],))
+            return lambda value: value is None or isinstance(value, classes)
+
+    def accepts(value: Any) -> bool:
+        try:
+            check_type(value, hint)
+        except (TypeCheckError, TypeError):
+            return False
+        return True
+
+    return accepts
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolved_type_hints(func: Any) -> Dict[str, Any]:
+    """``get_type_hints(func, include_extras=True)`` resolved once per function.
+
+    The returned dict is shared; callers must not mutate it.
+    """
+    return get_type_hints(func, include_extras=True)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_binder(func: Any, exclude: frozenset[str]) -> "ArgumentBinder":
+    return ArgumentBinder(
+        func, exclude_params=exclude, type_hints=_resolved_type_hints(func)
+    )
+
+
 def ensure_type_hints(
     func: Any, *, exclude_params: Iterable[str] | None = None
 ) -> Dict[str, Any]:
@@ -30,6 +107,9 @@ def ensure_type_hints(
         func: The target function.
         exclude_params: Parameter names to ignore (e.g., dependency-injected params).
 
+    The resolved hints are cached per function, so later validation never has
+    to resolve them again.
+
     Returns:
         The resolved type hints for the function.
 
@@ -38,7 +118,7 @@ def ensure_type_hints(
     """
 
     exclude = _clean_excluded(exclude_params)
-    hints = get_type_hints(func, include_extras=True)
+    hints = _resolved_type_hints(func)
     missing = [
         name
         for name, param in inspect.signature(func).parameters.items()
@@ -51,7 +131,132 @@ def ensure_type_hints(
         raise SignatureValidationError(
             f"Function {func.__name__} is missing type hints for: {', '.join(missing)}"
         )
-    return hints
+    return dict(hints)
+
+
+class ArgumentBinder:
+    """Bind and validate call arguments against a precomputed signature.
+
+    Build one per function (e.g. at decoration time) and call :meth:`bind` for
+    every invocation, so the signature is inspected and the type hints are
+    resolved only once.
+    """
+
+    def __init__(
+        self,
+        func: Any,
+        *,
+        exclude_params: Iterable[str] | None = None,
+        type_hints: Mapping[str, Any] | None = None,
+    ) -> None:
+        """
+        Args:
+            func: The target function.
+            exclude_params: Parameter names to ignore during binding and validation.
+            type_hints: Already-resolved hints for ``func`` (e.g. from
+                :func:`ensure_type_hints`); resolved here when omitted.
+        """
+        self._func_name = func.__name__
+        exclude = _clean_excluded(exclude_params)
+        sig = inspect.signature(func)
+
+        # Drop excluded parameters from the signature for binding
+        self._signature = sig.replace(
+            parameters=[
+                param for name, param in sig.parameters.items() if name not in exclude
+            ]
+        )
+
+        # Precomputed state for the hand-rolled binder used in the common case
+        params = self._signature.parameters.values()
+        self._fast_bind = all(
+            p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+            for p in params
+        )
+        self._positional_names = tuple(
+            p.name for p in params if p.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
+        )
+        self._param_names = frozenset(self._signature.parameters)
+        self._defaults = {
+            p.name: p.default for p in params if p.default is not inspect.Parameter.empty
+        }
+
+        if type_hints is None:
+            type_hints = _resolved_type_hints(func)
+        # (name, hint, predicate) per annotated parameter; unchecked hints are dropped
+        checks = []
+        for name in self._signature.parameters:
+            hint = type_hints.get(name)
+            if hint is None:
+                continue
+            accepts = _compile_check(hint)
+            if accepts is not None:
+                checks.append((name, hint, accepts))
+        self._checks = tuple(checks)
+
+    def bind(self, args: Sequence[Any], kwargs: Mapping[str, Any]) -> Dict[str, Any]:
+        """Bind ``args``/``kwargs`` and validate them against the annotated types.
+
+        Returns:
+            A dictionary of bound arguments suitable for calling the function.
+
+        Raises:
+            SignatureValidationError: If required parameters are missing or types mismatch.
+        """
+        arguments = self._bind_fast(args, kwargs)
+        if arguments is None:
+            arguments = self._bind_slow(args, kwargs)
+
+        for name, expected, accepts in self._checks:
+            value = arguments[name]
+            if accepts(value):
+                continue
+            try:
+                # Re-run typeguard for the detailed error message
+                # typeguard 4.x uses check_type(value, expected_type)
+                # typeguard 2.x uses check_type(argname, value, expected_type)
+                check_type(value, expected)
+            except (TypeCheckError, TypeError) as exc:
+                raise SignatureValidationError(
+                    f"Argument '{name}' to {self._func_name} must be {expected!r}, got {type(value)!r}. "
+                    f"Value: {value!r}. Original error: {exc}"
+                ) from exc
+
+        return arguments
+
+    def _bind_fast(
+        self, args: Sequence[Any], kwargs: Mapping[str, Any]
+    ) -> Dict[str, Any] | None:
+        """Bind plain positional/keyword calls without ``Signature.bind``.
+
+        Returns None when the call needs the full binder, either because the
+        signature has variadic or positional-only parameters or because the
+        arguments are invalid (so the error message comes from ``inspect``).
+        """
+        if not self._fast_bind or len(args) > len(self._positional_names):
+            return None
+
+        arguments = dict(self._defaults)
+        if args:
+            positional = dict(zip(self._positional_names, args))
+            if not positional.keys().isdisjoint(kwargs):
+                return None
+            arguments.update(positional)
+        arguments.update(kwargs)
+
+        if arguments.keys() != self._param_names:
+            return None
+        return arguments
+
+    def _bind_slow(self, args: Sequence[Any], kwargs: Mapping[str, Any]) -> Dict[str, Any]:
+        try:
+            bound = self._signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+        except TypeError as exc:
+            raise SignatureValidationError(
+                f"Invalid arguments for {self._func_name}: {exc}"
+            ) from exc
+        return bound.arguments
 
 
 def bind_and_validate_arguments(
@@ -65,6 +270,8 @@ def bind_and_validate_arguments(
 
     This ensures required parameters are present and values match the annotated
     types. Excluded parameters are ignored for both binding and validation.
+    The :class:`ArgumentBinder` for each ``(func, exclude_params)`` pair is built
+    once and reused on later calls.
 
     Args:
         func: The target function.
@@ -79,40 +286,4 @@ def bind_and_validate_arguments(
         SignatureValidationError: If required parameters are missing or types mismatch.
     """
 
-    exclude = _clean_excluded(exclude_params)
-    sig = inspect.signature(func)
-
-    # Drop excluded parameters from the signature for binding
-    filtered_params = [
-        param
-        for name, param in sig.parameters.items()
-        if name not in exclude
-    ]
-    filtered_sig = sig.replace(parameters=filtered_params)
-
-    try:
-        bound = filtered_sig.bind(*args, **kwargs)
-        bound.apply_defaults()
-    except TypeError as exc:
-        raise SignatureValidationError(
-            f"Invalid arguments for {func.__name__}: {exc}"
-        ) from exc
-
-    hints = get_type_hints(func, include_extras=True)
-    for name, value in bound.arguments.items():
-        if name in exclude:
-            continue
-        expected = hints.get(name)
-        if expected is None:
-            continue
-        try:
-            # typeguard 4.x uses check_type(value, expected_type)
-            # typeguard 2.x uses check_type(argname, value, expected_type)
-            check_type(value, expected)
-        except TypeError as exc:
-            raise SignatureValidationError(
-                f"Argument '{name}' to {func.__name__} must be {expected!r}, got {type(value)!r}. "
-                f"Value: {value!r}. Original error: {exc}"
-            ) from exc
-
-    return bound.arguments
+    return _cached_binder(func, frozenset(exclude_params or ())).bind(args, kwargs)
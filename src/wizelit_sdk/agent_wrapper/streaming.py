@@ -2,10 +2,14 @@
 Real-time log streaming using Redis Pub/Sub.
 Enables push-based log delivery from workers to hub without polling.
 """
+import functools
 import json
 import logging
+import time
+import zlib
+from collections import deque
 from datetime import datetime, UTC
-from typing import AsyncGenerator, Optional, Dict, Any
+from typing import AsyncGenerator, Deque, Mapping, Optional, Dict, Any, Tuple
 import asyncio
 
 try:
@@ -16,20 +20,151 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# The serializer is chosen once at import time: orjson when installed, else stdlib json
+try:
+    import orjson
+except ImportError:
+    _HAS_ORJSON = False
+
+    def _json_default(value: Any) -> Any:
+        """Encode datetimes the way orjson does (RFC 3339 / isoformat)."""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    def _dumps(value: Any) -> str:
+        """Serialize an event with the stdlib json module."""
+        return json.dumps(value, default=_json_default)
+
+    _loads = json.loads
+else:
+    _HAS_ORJSON = True
+
+    def _dumps(value: Any) -> str:
+        """Serialize an event with orjson (Redis payloads are str)."""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _loads = orjson.loads
+
+
+@functools.lru_cache(maxsize=1024)
+def _json_log_prefix(job_id: str) -> str:
+    """Serialized ``{"job_id": ..., "message": `` head of a job's log events."""
+    return '{"job_id": ' + json.dumps(job_id) + ', "message": '
+
+
+@functools.lru_cache(maxsize=64)
+def _json_level(level: str) -> str:
+    return json.dumps(level)
+
+
+def _splice_json_log_event(
+    job_id: str, message: str, level: str, timestamp: datetime
+) -> str:
+    """
+    Build a log event payload for the stdlib json path without an event dict.
+
+    Only the message is serialized per call; the job prefix and level are cached.
+    Produces exactly ``json.dumps`` of the equivalent event dict.
+    """
+    return (
+        f"{_json_log_prefix(job_id)}{json.dumps(message)}, "
+        f'"level": {_json_level(level)}, "timestamp": "{timestamp.isoformat()}"}}'
+    )
+
+
+# Log events go to one of a fixed set of shared channels instead of one channel
+# per job, so long-lived subscribers never have to (un)subscribe as jobs come and go
+LOG_CHANNEL_SHARDS = 16
+
+
+@functools.lru_cache(maxsize=4096)
+def _log_channel(job_id: str) -> str:
+    """Shared log channel for a job (crc32, so it is stable across processes)."""
+    return f"wizelit:logs:{zlib.crc32(job_id.encode()) % LOG_CHANNEL_SHARDS}"
+
+
+# Redis clients shared by every LogStreamer with the same URL on the same event
+# loop: key -> [client, reference count]. The pool closes with the last user.
+_SharedClientKey = Tuple[str, asyncio.AbstractEventLoop]
+_shared_clients: Dict[_SharedClientKey, list] = {}
+
+
+def _acquire_client(redis_url: str) -> Tuple[_SharedClientKey, Any]:
+    """Return the shared client for ``redis_url`` on the running loop, taking a reference."""
+    key = (redis_url, asyncio.get_running_loop())
+    entry = _shared_clients.get(key)
+    if entry is None:
+        client = redis.from_url(
+            redis_url,
+            decode_responses=True,
+            socket_connect_timeout=5,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+        entry = _shared_clients[key] = [client, 0]
+    entry[1] += 1
+    return key, entry[0]
+
+
+async def _release_client(key: _SharedClientKey) -> None:
+    """Drop a reference to a shared client, closing it when no references remain."""
+    entry = _shared_clients.get(key)
+    if entry is None:
+        return
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del _shared_clients[key]
+        client = entry[0]
+        await client.close()
+        await client.connection_pool.disconnect()
+        logger.info("Redis connection closed")
+
+
 class LogStreamer:
     """
     Manages real-time log streaming via Redis Pub/Sub.
 
-    Workers publish log events to job-specific channels.
-    Hub subscribes to these channels for real-time updates.
+    Workers publish log events to ``LOG_CHANNEL_SHARDS`` shared channels
+    (``wizelit:logs:{shard}``), each event carrying its ``job_id``, and status
+    changes to ``job:{job_id}:status``. Hub subscribes to these channels for
+    real-time updates, filtering log events by ``job_id``.
+
+    Log events are buffered and published in pipelined batches: a batch is sent
+    once ``batch_size`` events are pending or ``flush_ms`` after the first one.
+    The buffer holds at most ``max_pending`` events; when Redis falls behind the
+    oldest log events are dropped. Status changes never enter the buffer: they
+    are published immediately, after any buffered logs, in the same round-trip,
+    together with the job's latest state (``job:{job_id}:state``, see
+    ``get_job_state``).
     """
 
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    # Longest single wait for a pub/sub message in subscribe_logs
+    SUBSCRIBE_POLL_SECONDS = 1.0
+    # Lifetime of the job:{job_id}:state key written with each status change
+    STATE_TTL_SECONDS = 3600
+    # Stores the latest status event and publishes it atomically
+    # (KEYS: state key, status channel; ARGV: event, TTL)
+    _STATUS_SCRIPT = (
+        "redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2]) "
+        "return redis.call('PUBLISH', KEYS[2], ARGV[1])"
+    )
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        batch_size: int = 100,
+        flush_ms: float = 10.0,
+        max_pending: int = 10_000,
+    ):
         """
         Initialize the log streamer.
 
         Args:
             redis_url: Redis connection URL
+            batch_size: Publish as soon as this many log events are buffered (1 disables batching)
+            flush_ms: Maximum time a buffered log event waits before being published
+            max_pending: Maximum buffered log events; the oldest are dropped beyond this
         """
         if redis is None:
             raise ImportError(
@@ -38,27 +173,60 @@ class LogStreamer:
             )
 
         self.redis_url = redis_url
+        self.batch_size = max(1, batch_size)
+        self.flush_ms = flush_ms
         self._redis: Optional[redis.Redis] = None
+        # Set while holding a reference to a shared client
+        self._client_key: Optional[_SharedClientKey] = None
         self._pubsub: Optional[redis.client.PubSub] = None
+        # (channel, payload) of buffered log events
+        self._pending: Deque[Tuple[str, str]] = deque(
+            maxlen=max(1, max_pending)
+        )
+        self._dropped = 0
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_delayed = False
+        self._flush_lock = asyncio.Lock()
+        self._connect_lock = asyncio.Lock()
 
     async def _ensure_connected(self) -> redis.Redis:
-        """Ensure Redis connection is established."""
+        """Ensure Redis connection is established (on the client shared per URL)."""
         if self._redis is None:
-            try:
-                self._redis = redis.from_url(
-                    self.redis_url,
-                    decode_responses=True,
-                    socket_connect_timeout=5,
-                    socket_keepalive=True,
-                )
-                # Test connection
-                await self._redis.ping()
-                logger.info(f"Connected to Redis at {self.redis_url}")
-            except Exception as e:
-                logger.error(f"Failed to connect to Redis: {e}")
-                raise
+            # connect() runs as a background task while publishes may also connect;
+            # only one of them may take a reference on the shared client
+            async with self._connect_lock:
+                if self._redis is None:
+                    key, client = _acquire_client(self.redis_url)
+                    try:
+                        # Test connection
+                        await client.ping()
+                    except Exception as e:
+                        logger.error(f"Failed to connect to Redis: {e}")
+                        await _release_client(key)
+                        raise
+                    if self._redis is None:
+                        self._redis, self._client_key = client, key
+                        logger.info(f"Connected to Redis at {self.redis_url}")
+                    else:
+                        await _release_client(key)
         return self._redis
 
+    @property
+    def is_connected(self) -> bool:
+        """Whether a Redis connection has been established."""
+        return self._redis is not None
+
+    async def connect(self) -> None:
+        """
+        Establish the Redis connection ahead of the first publish.
+        Failures are logged and the connection is retried on the next publish.
+        """
+        try:
+            await self._ensure_connected()
+        except Exception:
+            # Already logged; the next publish retries
+            pass
+
     async def publish_log(
         self,
         job_id: str,
@@ -69,6 +237,8 @@ class LogStreamer:
         """
         Publish a log event to Redis.
 
+        The event is buffered and sent with the next batch (see ``flush``).
+
         Args:
             job_id: Job identifier
             message: Log message
@@ -76,24 +246,83 @@ class LogStreamer:
             metadata: Additional metadata to include
         """
         try:
-            redis_client = await self._ensure_connected()
+            if self._buffer_log(job_id, message, level, metadata):
+                await self.flush()
+            elif self._flush_task is None:
+                self._schedule_flush(self.flush_ms / 1000)
 
-            event = {
+        except Exception as e:
+            # Don't let streaming errors break the main execution
+            logger.error(f"Failed to publish log for job {job_id}: {e}")
+
+    def enqueue_log(
+        self,
+        job_id: str,
+        message: str,
+        level: str = "INFO",
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Buffer a log event without awaiting (e.g. from a logging handler).
+
+        Must be called on the event loop thread. A full batch is flushed by a
+        scheduled task rather than one task per event.
+
+        Args:
+            job_id: Job identifier
+            message: Log message
+            level: Log level (INFO, ERROR, WARNING, DEBUG)
+            metadata: Additional metadata to include
+        """
+        try:
+            if self._buffer_log(job_id, message, level, metadata):
+                if self._flush_task is None or self._flush_delayed:
+                    self._schedule_flush(0)
+            elif self._flush_task is None:
+                self._schedule_flush(self.flush_ms / 1000)
+        except Exception as e:
+            # Don't let streaming errors break the main execution
+            logger.error(f"Failed to buffer log for job {job_id}: {e}")
+
+    def _buffer_log(
+        self,
+        job_id: str,
+        message: str,
+        level: str,
+        metadata: Optional[Dict[str, Any]],
+    ) -> bool:
+        """Append a log event to the buffer; returns True once a batch is full."""
+        timestamp = datetime.now(UTC)
+        if not _HAS_ORJSON and not metadata:
+            # stdlib json is slow on dicts; splice a pre-serialized frame instead
+            payload = _splice_json_log_event(job_id, message, level, timestamp)
+        else:
+            event: Dict[str, Any] = {
                 "job_id": job_id,
                 "message": message,
                 "level": level,
-                "timestamp": datetime.now(UTC).isoformat(),
+                # Encoded by the serializer; no intermediate isoformat() string
+                "timestamp": timestamp,
             }
-
             if metadata:
                 event["metadata"] = metadata
-
-            channel = f"job:{job_id}:logs"
-            await redis_client.publish(channel, json.dumps(event))
-
-        except Exception as e:
-            # Don't let streaming errors break the main execution
-            logger.error(f"Failed to publish log for job {job_id}: {e}")
+            payload = _dumps(event)
+
+        channel = _log_channel(job_id)
+        if len(self._pending) == self._pending.maxlen:
+            # deque(maxlen=...) discards the oldest event on append
+            self._dropped += 1
+        self._pending.append((channel, payload))
+        return len(self._pending) >= self.batch_size
+
+    def _schedule_flush(self, delay: float) -> None:
+        """(Re)schedule the background flush to run after ``delay`` seconds."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        self._flush_delayed = delay > 0
+        self._flush_task = asyncio.get_running_loop().create_task(
+            self._flush_after_delay(delay)
+        )
 
     async def publish_status_change(
         self,
@@ -112,12 +341,10 @@ class LogStreamer:
             error: Error message (for failed jobs)
         """
         try:
-            redis_client = await self._ensure_connected()
-
             event = {
                 "job_id": job_id,
                 "status": status,
-                "timestamp": datetime.now(UTC).isoformat(),
+                "timestamp": datetime.now(UTC),
             }
 
             if result is not None:
@@ -125,13 +352,142 @@ class LogStreamer:
             if error is not None:
                 event["error"] = error
 
-            channel = f"job:{job_id}:status"
-            await redis_client.publish(channel, json.dumps(event))
+            # Sent with the buffered logs, after them, in one pipelined
+            # round-trip; kept out of the bounded buffer so it is never dropped
+            await self._flush(
+                (f"job:{job_id}:status", _dumps(event), f"job:{job_id}:state")
+            )
             logger.info(f"Published status change for job {job_id}: {status}")
 
         except Exception as e:
             logger.error(f"Failed to publish status change for job {job_id}: {e}")
 
+    async def publish_heartbeat(
+        self,
+        job_id: str,
+        elapsed_seconds: int,
+        ttl_seconds: int = 30,
+    ) -> None:
+        """
+        Record that a job is still running.
+
+        Sets ``job:{job_id}:heartbeat`` to the elapsed seconds with a TTL instead of
+        publishing a log event, so heartbeats never reach log subscribers or the
+        database. Read it back with ``get_heartbeat``.
+
+        Args:
+            job_id: Job identifier
+            elapsed_seconds: Seconds since the job started
+            ttl_seconds: Expiry of the heartbeat key
+        """
+        await self.publish_heartbeats({job_id: elapsed_seconds}, ttl_seconds)
+
+    async def publish_heartbeats(
+        self,
+        heartbeats: Mapping[str, int],
+        ttl_seconds: int = 30,
+    ) -> None:
+        """
+        Record heartbeats for several jobs in one pipelined round-trip.
+
+        Args:
+            heartbeats: Mapping of job identifier to elapsed seconds
+            ttl_seconds: Expiry of the heartbeat keys
+        """
+        if not heartbeats:
+            return
+        try:
+            redis_client = await self._ensure_connected()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for job_id, elapsed_seconds in heartbeats.items():
+                    pipe.set(f"job:{job_id}:heartbeat", elapsed_seconds, ex=ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to publish heartbeats for {len(heartbeats)} job(s): {e}")
+
+    async def get_heartbeat(self, job_id: str) -> Optional[int]:
+        """
+        Return the elapsed seconds from a job's latest heartbeat.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Elapsed seconds, or None if no heartbeat was recorded within its TTL
+        """
+        redis_client = await self._ensure_connected()
+        value = await redis_client.get(f"job:{job_id}:heartbeat")
+        return int(value) if value is not None else None
+
+    async def get_job_state(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a job's latest status event, for subscribers that missed it.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The last published status event, or None if none was published
+            within ``STATE_TTL_SECONDS``
+        """
+        redis_client = await self._ensure_connected()
+        value = await redis_client.get(f"job:{job_id}:state")
+        return _loads(value) if value is not None else None
+
+    async def flush(self) -> None:
+        """Publish all buffered log events in a single pipelined round-trip."""
+        await self._flush()
+
+    async def _flush(self, status: Optional[Tuple[str, str, str]] = None) -> None:
+        """
+        Publish buffered log events, then ``status`` if given, in one round-trip.
+
+        Args:
+            status: (channel, payload, state key) of a status event to send last
+        """
+        async with self._flush_lock:
+            if not self._pending and status is None:
+                return
+            batch = list(self._pending)
+            self._pending.clear()
+            if self._dropped:
+                logger.warning(
+                    f"Dropped {self._dropped} log event(s) while Redis publishing lagged"
+                )
+                self._dropped = 0
+
+            try:
+                redis_client = await self._ensure_connected()
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for channel, payload in batch:
+                        pipe.publish(channel, payload)
+                    if status is not None:
+                        channel, payload, state_key = status
+                        pipe.eval(
+                            self._STATUS_SCRIPT,
+                            2,
+                            state_key,
+                            channel,
+                            payload,
+                            self.STATE_TTL_SECONDS,
+                        )
+                    await pipe.execute()
+            except Exception as e:
+                # Don't let streaming errors break the main execution
+                if status is not None:
+                    raise
+                logger.error(f"Failed to publish {len(batch)} buffered log event(s): {e}")
+
+    async def _flush_after_delay(self, delay: float) -> None:
+        """Flush buffered events once ``delay`` seconds have elapsed."""
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            # A cancelled task may finish after its replacement was scheduled
+            if self._flush_task is asyncio.current_task():
+                self._flush_task = None
+        await self.flush()
+
     async def subscribe_logs(
         self,
         job_id: str,
@@ -148,37 +504,51 @@ class LogStreamer:
             Dict containing log event data
         """
         redis_client = await self._ensure_connected()
-        pubsub = redis_client.pubsub()
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
 
         try:
-            # Subscribe to both logs and status channels
-            log_channel = f"job:{job_id}:logs"
+            # Subscribe to the job's log shard and its status channel
+            log_channel = _log_channel(job_id)
             status_channel = f"job:{job_id}:status"
             await pubsub.subscribe(log_channel, status_channel)
             logger.info(f"Subscribed to channels for job {job_id}")
 
-            start_time = asyncio.get_event_loop().time() if timeout else None
+            # Deadline computed once; each message only compares against the clock
+            deadline = time.monotonic() + timeout if timeout else None
 
-            async for message in pubsub.listen():
-                # Check timeout
-                if timeout and start_time:
-                    elapsed = asyncio.get_event_loop().time() - start_time
-                    if elapsed > timeout:
+            # Poll with get_message rather than iterating listen(): no generator
+            # layer per message, and the timeout is honoured while the channel is idle
+            while True:
+                wait = self.SUBSCRIBE_POLL_SECONDS
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
                         logger.info(f"Subscription timeout for job {job_id}")
                         break
+                    wait = min(wait, remaining)
 
-                if message["type"] == "message":
-                    try:
-                        event = json.loads(message["data"])
-                        yield event
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=wait
+                )
+                if message is None or message["type"] != "message":
+                    continue
+
+                try:
+                    event = _loads(message["data"])
+                except json.JSONDecodeError as e:
+                    logger.error(f"Failed to decode message: {e}")
+                    continue
+
+                # The log shard is shared with other jobs
+                if message["channel"] == log_channel and event.get("job_id") != job_id:
+                    continue
 
-                        # Stop listening if job is completed or failed
-                        if event.get("status") in ["completed", "failed"]:
-                            logger.info(f"Job {job_id} finished with status: {event.get('status')}")
-                            break
+                yield event
 
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode message: {e}")
+                # Stop listening if job is completed or failed
+                if event.get("status") in ["completed", "failed"]:
+                    logger.info(f"Job {job_id} finished with status: {event.get('status')}")
+                    break
 
         except asyncio.CancelledError:
             logger.info(f"Subscription cancelled for job {job_id}")
@@ -189,8 +559,16 @@ class LogStreamer:
             await pubsub.close()
 
     async def close(self) -> None:
-        """Close Redis connection."""
-        if self._redis:
+        """Flush buffered log events and release the Redis connection."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+        if self._client_key is not None:
+            # Shared client: closed once the last streamer using it is closed
+            key, self._client_key, self._redis = self._client_key, None, None
+            await _release_client(key)
+        elif self._redis:
             await self._redis.close()
             await self._redis.connection_pool.disconnect()
             self._redis = None
@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import (
     AsyncEngine
 )
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Dict, Optional
 import logging
 import os
 
@@ -14,6 +14,24 @@ from wizelit_sdk.models.base import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Engine options for JSON/JSONB columns (e.g. JobModel.result): orjson when
+# installed, otherwise SQLAlchemy's stdlib json default
+try:
+    import orjson
+except ImportError:
+    _JSON_ENGINE_OPTIONS: Dict[str, Any] = {}
+else:
+
+    def _orjson_serializer(value: Any) -> str:
+        """Serialize JSON/JSONB bind values with orjson (the asyncpg codec expects str)."""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _JSON_ENGINE_OPTIONS = {
+        "json_serializer": _orjson_serializer,
+        "json_deserializer": orjson.loads,
+    }
+
+
 class DatabaseManager:
     """Singleton database manager with connection pooling."""
 
@@ -60,6 +78,7 @@ class DatabaseManager:
             pool_recycle=self.POOL_RECYCLE,
             echo=self.ECHO_SQL,
             pool_pre_ping=True,
+            **_JSON_ENGINE_OPTIONS,
         )
 
         # Create async session factory
@@ -1,206 +1,420 @@
 """
 Custom exceptions for Wizelit SDK with helpful error messages and suggestions.
 """
+import operator
+import string
+import sys
+from typing import Any, Callable, ClassVar, Dict, Optional
+
+
+# ASCII-only so messages stay on the fast encode path and print on any terminal
+_SUGGESTION_PREFIX = "\nSuggestion: "
+
+
+# Identifiers that config_key / transport_type / operation are usually drawn from,
+# interned once so repeated raises share them and compare by identity
+_KNOWN_IDENTIFIERS = {
+    name: sys.intern(name)
+    for name in (
+        # Configuration keys
+        "REDIS_URL",
+        "POSTGRES_USER",
+        "POSTGRES_PASSWORD",
+        "POSTGRES_HOST",
+        "POSTGRES_PORT",
+        "POSTGRES_DB",
+        "DB_POOL_SIZE",
+        "DB_MAX_OVERFLOW",
+        "DB_POOL_TIMEOUT",
+        "DB_POOL_RECYCLE",
+        "DB_ECHO_SQL",
+        # Transports
+        "sse",
+        "http",
+        "streamable-http",
+        "stdio",
+        # Operations
+        "connect",
+        "query",
+        "health_check",
+        "init_db",
+    )
+}
+
+
+def _known(identifier: str) -> str:
+    """Return the interned copy of a well-known identifier (others unchanged)."""
+    return _KNOWN_IDENTIFIERS.get(identifier, identifier)
+
+
+class _Attributes:
+    """Read-only mapping view of an object's attributes, for ``str.format_map``."""
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj: object):
+        self._obj = obj
+
+    def __getitem__(self, name: str) -> Any:
+        return getattr(self._obj, name)
+
+
+def _compile_template(template: str) -> Callable[[object], str]:
+    """
+    Compile a ``str.format`` suggestion template into a formatter of an instance.
+
+    Plain ``{name}`` fields become a %-format string plus one attrgetter, so
+    filling the template is a single C-level call. Templates using format specs,
+    conversions or dotted fields fall back to ``format_map``.
+    """
+    pieces, fields = [], []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        pieces.append(literal.replace("%", "%%"))
+        if field is None:
+            continue
+        if spec or conversion or not field.isidentifier():
+            return lambda obj: template.format_map(_Attributes(obj))
+        pieces.append("%s")
+        fields.append(field)
+
+    if not fields:
+        text = template.format()
+        return lambda obj: text
+    fmt = "".join(pieces)
+    getter = operator.attrgetter(*fields)
+    if len(fields) == 1:
+        return lambda obj: fmt % (getter(obj),)
+    return lambda obj: fmt % getter(obj)
+
+
+def _suggestion_formatter(cls: type) -> Callable[[object], str]:
+    """Formatter for a class's suggestion: its compiled template, else its constant."""
+    template = cls.SUGGESTION_TEMPLATE
+    if template:
+        return _compile_template(template)
+    text = cls.SUGGESTION
+    return lambda obj: text
+
+
+# Suggestion formatter per exception class, registered when the class is created.
+# Instances keep only their raw fields and render the suggestion from here.
+_SUGGESTIONS: Dict[type, Callable[[object], str]] = {}
 
 
 class WizelitSDKException(Exception):
-    """Base exception class for all Wizelit SDK errors."""
+    """
+    Base exception class for all Wizelit SDK errors.
 
-    def __init__(self, message: str, suggestion: str = ""):
-        self.message = message
-        self.suggestion = suggestion
-        full_message = message
-        if suggestion:
-            full_message = f"{message}\n💡 Suggestion: {suggestion}"
-        super().__init__(full_message)
+    Only the short message is passed to ``Exception``; the message and the
+    suggestion are joined on the first ``str()`` so that errors which are caught
+    and never displayed do not pay for it.
+
+    Subclasses declare their suggestion once as ``SUGGESTION``, or as
+    ``SUGGESTION_TEMPLATE`` when it names instance attributes (compiled when
+    the class is created and rendered from the instance's fields on access);
+    an explicit ``suggestion`` argument overrides both. Only such overrides
+    are stored on the instance.
+
+    Instances use ``__slots__`` (each subclass lists its own fields), so raising
+    one does not allocate an attribute dict.
+    """
+
+    __slots__ = ("_full_message", "_suggestion")
+
+    SUGGESTION: ClassVar[str] = ""
+    SUGGESTION_TEMPLATE: ClassVar[str] = ""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _SUGGESTIONS[cls] = _suggestion_formatter(cls)
+
+    def __init__(self, message: str, suggestion: Optional[str] = None):
+        super().__init__(message)
+        self._suggestion = suggestion
+        self._full_message: Optional[str] = None
+
+    @property
+    def message(self) -> str:
+        """Short description of the error (the only exception argument)."""
+        return self.args[0]
+
+    @message.setter
+    def message(self, value: str) -> None:
+        self.args = (value,)
+        self._full_message = None
+
+    @property
+    def suggestion(self) -> str:
+        """Numbered hints for fixing the error."""
+        if self._suggestion is not None:
+            return self._suggestion
+        return _SUGGESTIONS[type(self)](self)
+
+    @suggestion.setter
+    def suggestion(self, value: Optional[str]) -> None:
+        self._suggestion = value
+        self._full_message = None
+
+    def __str__(self) -> str:
+        if self._full_message is None:
+            full_message = self.message
+            suggestion = self.suggestion
+            if suggestion:
+                full_message = f"{full_message}{_SUGGESTION_PREFIX}{suggestion}"
+            self._full_message = full_message
+        return self._full_message
+
+
+_SUGGESTIONS[WizelitSDKException] = _suggestion_formatter(WizelitSDKException)
 
 
 class AgentInitializationError(WizelitSDKException):
     """Raised when WizelitAgent cannot be initialized."""
 
+    __slots__ = ("original_error", "reason")
+
+    SUGGESTION = (
+        "1. Verify all required dependencies are installed\n"
+        "2. Check that the name parameter is provided\n"
+        "3. Verify the transport mode is valid (sse, http, streamable-http, stdio)\n"
+        "4. Check that host and port are available and not in use\n"
+        "5. Review the initialization code for configuration errors"
+    )
+
     def __init__(self, reason: str = "", original_error: str = ""):
-        message = "Failed to initialize WizelitAgent"
-        if reason:
-            message += f": {reason}"
-        if original_error:
-            message += f" ({original_error})"
-        suggestion = (
-            "1. Verify all required dependencies are installed\n"
-            "2. Check that the name parameter is provided\n"
-            "3. Verify the transport mode is valid (sse, http, streamable-http, stdio)\n"
-            "4. Check that host and port are available and not in use\n"
-            "5. Review the initialization code for configuration errors"
+        message = (
+            "Failed to initialize WizelitAgent"
+            f"{f': {reason}' if reason else ''}"
+            f"{f' ({original_error})' if original_error else ''}"
         )
-        super().__init__(message, suggestion)
+        super().__init__(message)
+        self.reason = reason
+        self.original_error = original_error
 
 
 class SignatureValidationError(WizelitSDKException):
     """Raised when a function signature doesn't meet requirements."""
 
+    __slots__ = ("function_name", "reason")
+
+    SUGGESTION_TEMPLATE = (
+        "1. Ensure all parameters of '{function_name}' have type hints\n"
+        "2. Verify parameter names match between definition and usage\n"
+        "3. Check that the function signature is compatible with the ingest decorator\n"
+        "4. Ensure complex types are properly imported and defined\n"
+        "5. Review the decorator parameters for compatibility"
+    )
+
     def __init__(self, function_name: str, reason: str = ""):
-        message = f"Signature validation failed for function '{function_name}'"
-        if reason:
-            message += f": {reason}"
-        suggestion = (
-            f"1. Ensure all parameters of '{function_name}' have type hints\n"
-            f"2. Verify parameter names match between definition and usage\n"
-            f"3. Check that the function signature is compatible with the ingest decorator\n"
-            f"4. Ensure complex types are properly imported and defined\n"
-            f"5. Review the decorator parameters for compatibility"
+        message = (
+            f"Signature validation failed for function '{function_name}'"
+            f"{f': {reason}' if reason else ''}"
         )
-        super().__init__(message, suggestion)
+        super().__init__(message)
+        self.function_name = function_name
+        self.reason = reason
 
 
 class JobExecutionError(WizelitSDKException):
     """Raised when a job fails during execution."""
 
+    __slots__ = ("job_id", "original_error", "reason")
+
+    SUGGESTION = (
+        "1. Check the job logs for detailed error information\n"
+        "2. Verify job inputs are valid and complete\n"
+        "3. Check if the underlying tool/function has dependencies\n"
+        "4. Try running the job again with the same inputs\n"
+        "5. Check application logs and database logs for more context"
+    )
+
     def __init__(self, job_id: str, reason: str = "", original_error: str = ""):
-        message = f"Job execution failed for job_id '{job_id}'"
-        if reason:
-            message += f": {reason}"
-        if original_error:
-            message += f" ({original_error})"
-        suggestion = (
-            "1. Check the job logs for detailed error information\n"
-            "2. Verify job inputs are valid and complete\n"
-            "3. Check if the underlying tool/function has dependencies\n"
-            "4. Try running the job again with the same inputs\n"
-            "5. Check application logs and database logs for more context"
+        message = (
+            f"Job execution failed for job_id '{job_id}'"
+            f"{f': {reason}' if reason else ''}"
+            f"{f' ({original_error})' if original_error else ''}"
         )
-        super().__init__(message, suggestion)
+        super().__init__(message)
+        self.job_id = job_id
+        self.reason = reason
+        self.original_error = original_error
 
 
 class JobNotFoundError(WizelitSDKException):
     """Raised when a job cannot be found."""
 
+    __slots__ = ("job_id",)
+
+    SUGGESTION = (
+        "1. Verify the job_id is correct and complete\n"
+        "2. Check if the job has expired or been deleted\n"
+        "3. Verify the job was created in the current session\n"
+        "4. Check the database for job records\n"
+        "5. Review job retention policies"
+    )
+
     def __init__(self, job_id: str):
-        message = f"Job not found: {job_id}"
-        suggestion = (
-            "1. Verify the job_id is correct and complete\n"
-            "2. Check if the job has expired or been deleted\n"
-            "3. Verify the job was created in the current session\n"
-            "4. Check the database for job records\n"
-            "5. Review job retention policies"
-        )
-        super().__init__(message, suggestion)
+        super().__init__(f"Job not found: {job_id}")
+        self.job_id = job_id
 
 
 class ToolRegistrationError(WizelitSDKException):
     """Raised when a tool cannot be registered with the MCP server."""
 
+    __slots__ = ("reason", "tool_name")
+
+    SUGGESTION_TEMPLATE = (
+        "1. Verify '{tool_name}' function is properly decorated with @ingest\n"
+        "2. Check that function name is unique across all registered tools\n"
+        "3. Verify function signature is valid with type hints\n"
+        "4. Check for duplicate tool registrations\n"
+        "5. Ensure the FastMCP server is properly initialized"
+    )
+
     def __init__(self, tool_name: str, reason: str = ""):
-        message = f"Failed to register tool '{tool_name}' with MCP server"
-        if reason:
-            message += f": {reason}"
-        suggestion = (
-            f"1. Verify '{tool_name}' function is properly decorated with @ingest\n"
-            f"2. Check that function name is unique across all registered tools\n"
-            f"3. Verify function signature is valid with type hints\n"
-            f"4. Check for duplicate tool registrations\n"
-            f"5. Ensure the FastMCP server is properly initialized"
+        message = (
+            f"Failed to register tool '{tool_name}' with MCP server"
+            f"{f': {reason}' if reason else ''}"
         )
-        super().__init__(message, suggestion)
+        super().__init__(message)
+        self.tool_name = tool_name
+        self.reason = reason
 
 
 class DatabaseManagerError(WizelitSDKException):
     """Raised when database operations fail."""
 
+    __slots__ = ("operation", "reason")
+
+    SUGGESTION = (
+        "1. Verify the database is running and accessible\n"
+        "2. Check database connection parameters (host, port, credentials)\n"
+        "3. Verify the database has sufficient disk space\n"
+        "4. Check if the database tables are properly initialized\n"
+        "5. Review database logs for detailed error information"
+    )
+
     def __init__(self, operation: str, reason: str = ""):
-        message = f"Database operation failed: {operation}"
-        if reason:
-            message += f" ({reason})"
-        suggestion = (
-            "1. Verify the database is running and accessible\n"
-            "2. Check database connection parameters (host, port, credentials)\n"
-            "3. Verify the database has sufficient disk space\n"
-            "4. Check if the database tables are properly initialized\n"
-            "5. Review database logs for detailed error information"
+        message = (
+            f"Database operation failed: {operation}"
+            f"{f' ({reason})' if reason else ''}"
         )
-        super().__init__(message, suggestion)
+        super().__init__(message)
+        self.operation = _known(operation)
+        self.reason = reason
 
 
 class StreamingError(WizelitSDKException):
     """Raised when log streaming fails."""
 
+    __slots__ = ("original_error", "reason")
+
+    SUGGESTION = (
+        "1. Verify Redis is running and accessible\n"
+        "2. Check REDIS_URL environment variable is set correctly\n"
+        "3. Verify network connectivity to Redis\n"
+        "4. Check Redis logs for connection errors\n"
+        "5. Log streaming is optional - the SDK will continue without it"
+    )
+
     def __init__(self, reason: str = "", original_error: str = ""):
-        message = "Error in log streaming"
-        if reason:
-            message += f": {reason}"
-        if original_error:
-            message += f" ({original_error})"
-        suggestion = (
-            "1. Verify Redis is running and accessible\n"
-            "2. Check REDIS_URL environment variable is set correctly\n"
-            "3. Verify network connectivity to Redis\n"
-            "4. Check Redis logs for connection errors\n"
-            "5. Log streaming is optional - the SDK will continue without it"
+        message = (
+            "Error in log streaming"
+            f"{f': {reason}' if reason else ''}"
+            f"{f' ({original_error})' if original_error else ''}"
         )
-        super().__init__(message, suggestion)
+        super().__init__(message)
+        self.reason = reason
+        self.original_error = original_error
 
 
 class ContextVariableError(WizelitSDKException):
     """Raised when context variable operations fail."""
 
+    __slots__ = ("reason", "variable_name")
+
+    SUGGESTION_TEMPLATE = (
+        "1. Ensure '{variable_name}' is set before accessing\n"
+        "2. Verify the context is active in the current async task\n"
+        "3. Check if using the decorator or dependency injection correctly\n"
+        "4. Ensure context propagation across async calls\n"
+        "5. Review context variable usage documentation"
+    )
+
     def __init__(self, variable_name: str, reason: str = ""):
-        message = f"Error accessing context variable '{variable_name}'"
-        if reason:
-            message += f": {reason}"
-        suggestion = (
-            f"1. Ensure '{variable_name}' is set before accessing\n"
-            f"2. Verify the context is active in the current async task\n"
-            f"3. Check if using the decorator or dependency injection correctly\n"
-            f"4. Ensure context propagation across async calls\n"
-            f"5. Review context variable usage documentation"
+        message = (
+            f"Error accessing context variable '{variable_name}'"
+            f"{f': {reason}' if reason else ''}"
         )
-        super().__init__(message, suggestion)
+        super().__init__(message)
+        self.variable_name = variable_name
+        self.reason = reason
 
 
 class InvalidConfigError(WizelitSDKException):
     """Raised when configuration is invalid or missing."""
 
+    __slots__ = ("config_key", "expected_type", "reason")
+
+    SUGGESTION_TEMPLATE = (
+        "1. Verify {config_key} is set in environment variables\n"
+        "2. Check the value format and type\n"
+        "3. Review configuration documentation for valid values\n"
+        "4. Check .env file or deployment configuration\n"
+        "5. Restart the application after fixing configuration"
+    )
+
     def __init__(self, config_key: str, expected_type: str = "", reason: str = ""):
-        message = f"Invalid configuration for '{config_key}'"
-        if expected_type:
-            message += f" (expected: {expected_type})"
-        if reason:
-            message += f": {reason}"
-        suggestion = (
-            f"1. Verify {config_key} is set in environment variables\n"
-            f"2. Check the value format and type\n"
-            f"3. Review configuration documentation for valid values\n"
-            f"4. Check .env file or deployment configuration\n"
-            f"5. Restart the application after fixing configuration"
+        message = (
+            f"Invalid configuration for '{config_key}'"
+            f"{f' (expected: {expected_type})' if expected_type else ''}"
+            f"{f': {reason}' if reason else ''}"
         )
-        super().__init__(message, suggestion)
+        super().__init__(message)
+        self.config_key = _known(config_key)
+        self.expected_type = expected_type
+        self.reason = reason
 
 
 class TransportError(WizelitSDKException):
     """Raised when transport/communication errors occur."""
 
+    __slots__ = ("reason", "transport_type")
+
+    SUGGESTION_TEMPLATE = (
+        "1. Verify the {transport_type} transport is properly configured\n"
+        "2. Check network connectivity and firewall rules\n"
+        "3. Verify server ports are open and accessible\n"
+        "4. Check if there are proxy or routing issues\n"
+        "5. Review transport-specific logs for detailed information"
+    )
+
     def __init__(self, transport_type: str, reason: str = ""):
-        message = f"Transport error with '{transport_type}'"
-        if reason:
-            message += f": {reason}"
-        suggestion = (
-            f"1. Verify the {transport_type} transport is properly configured\n"
-            f"2. Check network connectivity and firewall rules\n"
-            f"3. Verify server ports are open and accessible\n"
-            f"4. Check if there are proxy or routing issues\n"
-            f"5. Review transport-specific logs for detailed information"
+        message = (
+            f"Transport error with '{transport_type}'"
+            f"{f': {reason}' if reason else ''}"
         )
-        super().__init__(message, suggestion)
+        super().__init__(message)
+        self.transport_type = _known(transport_type)
+        self.reason = reason
 
 
 class TimeoutError(WizelitSDKException):
     """Raised when an operation exceeds the timeout limit."""
 
+    __slots__ = ("operation", "timeout_seconds")
+
+    SUGGESTION_TEMPLATE = (
+        "1. The {operation} took too long to complete\n"
+        "2. Check if there are resource constraints (CPU, memory)\n"
+        "3. Simplify the job inputs or query\n"
+        "4. Check application and system logs for bottlenecks\n"
+        "5. Consider increasing timeout if the operation is expected to be slow"
+    )
+
     def __init__(self, operation: str, timeout_seconds: float):
-        message = f"Operation '{operation}' exceeded timeout of {timeout_seconds} seconds"
-        suggestion = (
-            f"1. The {operation} took too long to complete\n"
-            f"2. Check if there are resource constraints (CPU, memory)\n"
-            f"3. Simplify the job inputs or query\n"
-            f"4. Check application and system logs for bottlenecks\n"
-            f"5. Consider increasing timeout if the operation is expected to be slow"
+        super().__init__(
+            f"Operation '{operation}' exceeded timeout of {timeout_seconds} seconds"
         )
-        super().__init__(message, suggestion)
+        self.operation = _known(operation)
+        self.timeout_seconds = timeout_seconds
@@ -1,4 +1,4 @@
 from .base import BaseModel
-from .job import JobModel, JobLogModel, JobStatus
+from .job import JobModel, JobLogModel, JobRow, JobStatus
 
-__all__ = ["BaseModel", "JobModel", "JobLogModel", "JobStatus"]
+__all__ = ["BaseModel", "JobModel", "JobLogModel", "JobRow", "JobStatus"]
@@ -1,26 +1,99 @@
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Uuid
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+import operator
+import os
+import time
 import uuid
-from datetime import datetime
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Tuple
+
+
+def _uuid7() -> uuid.UUID:
+    """
+    Return a time-ordered UUID (RFC 9562 version 7).
+
+    The 48-bit millisecond timestamp prefix keeps new primary keys roughly
+    increasing, so inserts append to the end of the B-tree index instead of
+    landing on random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Set the version (0111) and variant (10) bits
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
+
+
+class Base(DeclarativeBase):
+    """Declarative base holding the shared metadata for all Wizelit models."""
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last get_timestamp() call, so
+# calls within the same second only format the microseconds
+_timestamp_prefix: Tuple[int, str] = (-1, "")
 
-Base = declarative_base()
 
 class TimestampMixin:
     """Mixin for models that need timestamp functionality."""
 
     @staticmethod
     def get_timestamp() -> str:
-        return datetime.utcnow().isoformat()
+        """Return the current UTC time as an ISO 8601 string (microsecond precision)."""
+        global _timestamp_prefix
+        us_total = time.time_ns() // 1_000
+        second, us = divmod(us_total, 1_000_000)
+        cached_second, prefix = _timestamp_prefix
+        if second != cached_second:
+            tm = time.gmtime(second)
+            prefix = (
+                f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+                f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+            )
+            _timestamp_prefix = (second, prefix)
+        return f"{prefix}.{us:06d}"
 
 
 class BaseModel(Base):
     """Abstract base model with common functionality."""
     __abstract__ = True
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # UUID v7 by default; Any so models can redeclare id with their own key type
+    id: Mapped[Any] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=_uuid7)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # The declarative base has mapped the class by now; abstract classes have no table
+        table = cls.__dict__.get("__table__")
+        if table is not None:
+            cls._column_accessors_cache = cls._build_column_accessors(table)
+
+    @staticmethod
+    def _build_column_accessors(
+        table: Any,
+    ) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]:
+        names = tuple(c.name for c in table.columns)
+        if len(names) == 1:
+            # attrgetter with one name returns the value, not a 1-tuple
+            single = operator.attrgetter(names[0])
+
+            def getter(obj: Any) -> Tuple[Any, ...]:
+                return (single(obj),)
+
+            return names, getter
+        return names, operator.attrgetter(*names)
+
+    @classmethod
+    def _column_accessors(cls) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]:
+        """
+        Return the column names and a getter that reads all of them at once.
+
+        Built when the mapped class is defined (or on first use) and cached on it.
+        """
+        accessors = cls.__dict__.get("_column_accessors_cache")
+        if accessors is None:
+            accessors = cls._build_column_accessors(cls.__table__)
+            cls._column_accessors_cache = accessors
+        return accessors
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary."""
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        names, getter = self._column_accessors()
+        return dict(zip(names, getter(self)))
@@ -1,21 +1,54 @@
 """
 Job and JobLog models for persistent storage of job execution data.
 """
-from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, Index
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Index, func, insert, select
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Iterable, Mapping, Optional, Sequence
 import enum
+import sys
 
 from wizelit_sdk.models.base import BaseModel
 
 
 
+def _utc_now():
+    """
+    Server-side UTC "now" for naive DateTime columns.
+    Used as both the INSERT expression and the DDL default, so PostgreSQL fills
+    the value even on tables created before the server default existed.
+    """
+    return func.timezone("utc", func.now())
+
+
+# Plain interned status strings for hot paths; avoids Enum attribute dispatch
+STATUS_RUNNING = sys.intern("running")
+STATUS_COMPLETED = sys.intern("completed")
+STATUS_FAILED = sys.intern("failed")
+
+
 class JobStatus(str, enum.Enum):
     """Enumeration of possible job statuses."""
-    RUNNING = "running"
-    COMPLETED = "completed"
-    FAILED = "failed"
+    RUNNING = STATUS_RUNNING
+    COMPLETED = STATUS_COMPLETED
+    FAILED = STATUS_FAILED
+
+
+@dataclass(frozen=True, slots=True)
+class JobRow:
+    """
+    Read-only snapshot of a job record.
+    Loaded through Core column selects, bypassing ORM instrumentation and the identity map.
+    """
+    id: str
+    status: str
+    result: Optional[Any]
+    error: Optional[str]
+    created_at: datetime
+    updated_at: datetime
 
 
 class JobModel(BaseModel):
@@ -25,15 +58,21 @@ class JobModel(BaseModel):
     """
     __tablename__ = "jobs"
 
-    id = Column(String(64), primary_key=True)  # JOB-xxxxx
-    status = Column(String(20), default=JobStatus.RUNNING.value, nullable=False)
-    result = Column(JSONB, nullable=True)  # JSON result for completed jobs
-    error = Column(Text, nullable=True)  # Error message for failed jobs
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    id: Mapped[str] = mapped_column(String(64), primary_key=True)  # JOB-xxxxx
+    status: Mapped[str] = mapped_column(String(20), default=STATUS_RUNNING, nullable=False)
+    result: Mapped[Optional[Any]] = mapped_column(JSONB, nullable=True)  # JSON result for completed jobs
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Error message for failed jobs
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=_utc_now(), server_default=_utc_now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=_utc_now(), server_default=_utc_now(), onupdate=_utc_now(), nullable=False
+    )
 
     # Relationship to logs
-    logs = relationship("JobLogModel", back_populates="job", cascade="all, delete-orphan")
+    logs: Mapped[list["JobLogModel"]] = relationship(
+        "JobLogModel", back_populates="job", cascade="all, delete-orphan"
+    )
 
     # Index for faster queries
     __table_args__ = (
@@ -41,9 +80,55 @@ class JobModel(BaseModel):
         Index('idx_job_created_at', 'created_at'),
     )
 
+    # Fetch server-generated timestamps via RETURNING instead of a lazy load
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<JobModel(id={self.id}, status={self.status})>"
 
+    @classmethod
+    async def fetch_rows(cls, session: AsyncSession, ids: Iterable[str]) -> list[JobRow]:
+        """
+        Fetch read-only job snapshots for the given ids.
+
+        Args:
+            session: Active database session
+            ids: Job identifiers to load
+
+        Returns:
+            List of JobRow instances for the ids that exist
+        """
+        result = await session.execute(
+            select(
+                cls.id, cls.status, cls.result, cls.error, cls.created_at, cls.updated_at
+            ).where(cls.id.in_(list(ids)))
+        )
+        return [JobRow(*row) for row in result.all()]
+
+    @classmethod
+    async def bulk_upsert(cls, session: AsyncSession, rows: Sequence[Mapping[str, Any]]) -> None:
+        """
+        Insert or update many jobs in a single statement (INSERT ... ON CONFLICT DO UPDATE).
+
+        Args:
+            session: Active database session (the caller commits)
+            rows: Mappings with id, status, result and error keys
+        """
+        if not rows:
+            return
+
+        stmt = pg_insert(cls).values(list(rows))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[cls.id],
+            set_={
+                "status": stmt.excluded.status,
+                "result": stmt.excluded.result,
+                "error": stmt.excluded.error,
+                "updated_at": _utc_now(),
+            },
+        )
+        await session.execute(stmt)
+
 
 class JobLogModel(BaseModel):
     """
@@ -52,14 +137,18 @@ class JobLogModel(BaseModel):
     """
     __tablename__ = "job_logs"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    job_id = Column(String(64), ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
-    message = Column(Text, nullable=False)
-    level = Column(String(20), nullable=False)  # INFO, ERROR, WARNING, DEBUG
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    job_id: Mapped[str] = mapped_column(
+        String(64), ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False
+    )
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    level: Mapped[str] = mapped_column(String(20), nullable=False)  # INFO, ERROR, WARNING, DEBUG
+    timestamp: Mapped[datetime] = mapped_column(
+        DateTime, default=_utc_now(), server_default=_utc_now(), nullable=False
+    )
 
     # Relationship to job
-    job = relationship("JobModel", back_populates="logs")
+    job: Mapped["JobModel"] = relationship("JobModel", back_populates="logs")
 
     # Indexes for faster queries
     __table_args__ = (
@@ -70,3 +159,69 @@ class JobLogModel(BaseModel):
 
     def __repr__(self) -> str:
         return f"<JobLogModel(id={self.id}, job_id={self.job_id}, level={self.level})>"
+
+    # Batches at least this large are written with COPY instead of INSERT
+    COPY_THRESHOLD = 1000
+
+    @classmethod
+    async def bulk_write(
+        cls,
+        session: AsyncSession,
+        rows: Sequence[Mapping[str, Any]],
+        copy_threshold: Optional[int] = None,
+    ) -> None:
+        """
+        Insert many log rows in one round-trip.
+
+        Small batches use an executemany INSERT; batches of ``copy_threshold`` rows
+        (default ``COPY_THRESHOLD``) or more are streamed with PostgreSQL COPY through
+        the asyncpg connection (falling back to the INSERT path if the driver has no
+        COPY support).
+
+        Args:
+            session: Active database session (the caller commits)
+            rows: Mappings with the same keys, e.g. job_id, message, level, timestamp
+            copy_threshold: Minimum batch size that uses COPY (1 always uses it)
+        """
+        if not rows:
+            return
+
+        if copy_threshold is None:
+            copy_threshold = cls.COPY_THRESHOLD
+        if len(rows) >= copy_threshold:
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            if driver_connection is not None and hasattr(driver_connection, "copy_records_to_table"):
+                columns = tuple(rows[0].keys())
+                await driver_connection.copy_records_to_table(
+                    cls.__tablename__,
+                    records=[tuple(row[c] for c in columns) for row in rows],
+                    columns=columns,
+                )
+                return
+
+        await session.execute(insert(cls), list(rows))
+
+    @classmethod
+    async def fetch_entries(
+        cls, session: AsyncSession, job_id: str, limit: int = 100
+    ) -> list[tuple[str, datetime, str]]:
+        """
+        Fetch a job's oldest log entries as plain (level, timestamp, message) rows.
+
+        Args:
+            session: Active database session
+            job_id: Job identifier
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of (level, timestamp, message) tuples ordered by timestamp
+        """
+        result = await session.execute(
+            select(cls.level, cls.timestamp, cls.message)
+            .where(cls.job_id == job_id)
+            .order_by(cls.timestamp.asc())
+            .limit(limit)
+        )
+        return [tuple(row) for row in result.all()]
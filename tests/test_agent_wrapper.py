@@ -0,0 +1,188 @@
+"""End-to-end tests for tools registered through WizelitAgent.ingest."""
+
+import asyncio
+import contextlib
+from typing import Any, Optional, cast
+
+from fastmcp import Client
+
+from wizelit_sdk.agent_wrapper import Job, WizelitAgent
+
+
+def _make_agent() -> WizelitAgent:
+    agent = WizelitAgent("test-agent", enable_streaming=False)
+
+    @agent.ingest(description="Add two numbers")
+    def add(a: int, b: int = 2) -> int:
+        return a + b
+
+    @agent.ingest()
+    async def maybe_text(text: str) -> Optional[str]:
+        return None
+
+    @agent.ingest()
+    async def job_id(label: str, job: Job) -> str:
+        job.logger.info(label)
+        return job.id
+
+    return agent
+
+
+def _call(agent: WizelitAgent, name: str, arguments: dict):
+    async def call():
+        async with Client(agent._mcp) as client:
+            return (await client.call_tool(name, arguments)).data
+
+    return asyncio.run(call())
+
+
+def test_list_tools_reports_registration_metadata():
+    agent = _make_agent()
+
+    @agent.ingest(is_long_running=True, llm_framework="crewai")
+    async def crew(topic: str, job: Job) -> str:
+        return topic
+
+    tools = agent.list_tools()
+    assert tools["add"] == {"is_long_running": False, "llm_framework": None}
+    assert tools["crew"] == {"is_long_running": True, "llm_framework": "crewai"}
+
+
+def test_fast_tool_applies_defaults():
+    agent = _make_agent()
+
+    assert _call(agent, "add", {"a": 1}) == 3
+    assert _call(agent, "add", {"a": 1, "b": 5}) == 6
+
+
+def test_none_result_is_coerced_for_str_returns():
+    agent = _make_agent()
+
+    assert _call(agent, "maybe_text", {"text": "x"}) == ""
+
+
+def test_job_parameter_is_injected():
+    agent = _make_agent()
+
+    assert _call(agent, "job_id", {"label": "hello"}).startswith("JOB-")
+
+
+def _job(job_id: str, status: str = "running") -> Job:
+    """A Job created outside a tool call (no FastMCP context)."""
+    job = Job(cast(Any, None), job_id=job_id)
+    job.status = status
+    return job
+
+
+def test_in_memory_jobs_evict_oldest_finished_first():
+    agent = WizelitAgent("test-agent", enable_streaming=False, max_in_memory_jobs=2)
+
+    agent._remember_job(_job("JOB-1", "running"))
+    agent._remember_job(_job("JOB-2", "completed"))
+    agent._remember_job(_job("JOB-3", "failed"))
+    assert list(agent._jobs) == ["JOB-1", "JOB-3"]
+
+    agent._jobs["JOB-3"].status = "running"
+    agent._remember_job(_job("JOB-4", "running"))
+    assert list(agent._jobs) == ["JOB-1", "JOB-3", "JOB-4"]
+
+
+class _RecordingDatabase:
+    def __init__(self):
+        self.sessions = 0
+
+    @contextlib.asynccontextmanager
+    async def get_session(self):
+        self.sessions += 1
+        yield object()
+
+
+def test_job_setters_coalesce_into_one_upsert(monkeypatch):
+    from wizelit_sdk.models.job import JobModel
+
+    upserts = []
+
+    async def fake_bulk_upsert(session, rows):
+        upserts.append(sorted(rows, key=lambda row: row["id"]))
+
+    monkeypatch.setattr(JobModel, "bulk_upsert", fake_bulk_upsert)
+
+    async def scenario():
+        db: Any = _RecordingDatabase()
+        agent = WizelitAgent(
+            "test-agent", enable_streaming=False, db_manager=db, job_flush_ms=1
+        )
+        jobs = [_job("JOB-1"), _job("JOB-2")]
+        for job in jobs:
+            agent._remember_job(job)
+
+        agent.set_job_result("JOB-1", "done")
+        agent.set_job_status("JOB-1", "completed")
+        agent.set_job_error("JOB-2", "boom")
+        await asyncio.sleep(0.05)
+
+        # The flush records what it wrote, so an unchanged job is not rewritten
+        jobs[0]._db_manager = db
+        await jobs[0].persist_to_db()
+        return db.sessions
+
+    assert asyncio.run(scenario()) == 1
+    assert upserts == [
+        [
+            {"id": "JOB-1", "status": "completed", "result": "done", "error": None},
+            {"id": "JOB-2", "status": "running", "result": None, "error": "boom"},
+        ]
+    ]
+
+
+def test_failed_job_flush_is_retried(monkeypatch):
+    from wizelit_sdk.models.job import JobModel
+
+    upserts = []
+
+    async def flaky_bulk_upsert(session, rows):
+        if not upserts:
+            upserts.append(None)
+            raise RuntimeError("database unavailable")
+        upserts.append([row["id"] for row in rows])
+
+    monkeypatch.setattr(JobModel, "bulk_upsert", flaky_bulk_upsert)
+
+    async def scenario():
+        agent = WizelitAgent(
+            "test-agent",
+            enable_streaming=False,
+            db_manager=cast(Any, _RecordingDatabase()),
+            job_flush_ms=1,
+            max_in_memory_jobs=1,
+        )
+        agent.JOB_FLUSH_RETRY_SECONDS = 0.01
+        agent._remember_job(_job("JOB-1"))
+        agent.set_job_status("JOB-1", "completed")
+        # Evicted before the flush; its update is still written
+        agent._remember_job(_job("JOB-2", "completed"))
+        assert list(agent._jobs) == ["JOB-2"]
+        await asyncio.sleep(0.1)
+
+    asyncio.run(scenario())
+    assert upserts == [None, ["JOB-1"]]
+
+
+class _RecordingStreamer:
+    def __init__(self):
+        self.events = []
+
+    async def connect(self):
+        self.events.append("connect")
+
+    async def close(self):
+        self.events.append("close")
+
+
+def test_server_lifespan_connects_and_closes_streamer():
+    agent = _make_agent()
+    streamer: Any = _RecordingStreamer()
+    agent._log_streamer = streamer
+
+    assert _call(agent, "add", {"a": 1}) == 3
+    assert streamer.events == ["connect", "close"]
@@ -0,0 +1,89 @@
+"""Tests for the SDK exception hierarchy."""
+
+from wizelit_sdk.exceptions import (
+    JobExecutionError,
+    JobNotFoundError,
+    ToolRegistrationError,
+    WizelitSDKException,
+)
+
+
+def test_str_joins_message_and_suggestion():
+    error = JobExecutionError("JOB-1", reason="boom", original_error="ValueError")
+
+    assert error.message == "Job execution failed for job_id 'JOB-1': boom (ValueError)"
+    assert str(error) == f"{error.message}\nSuggestion: {error.suggestion}"
+    assert str(error).isascii()
+    assert error.args == (error.message,)
+    assert (error.job_id, error.reason, error.original_error) == ("JOB-1", "boom", "ValueError")
+
+
+def test_full_message_is_built_once_on_demand():
+    error = JobNotFoundError("JOB-1")
+
+    assert error._full_message is None
+    assert str(error) is str(error)
+
+
+def test_suggestions_come_from_class_constants():
+    assert JobNotFoundError("JOB-1").suggestion is JobNotFoundError.SUGGESTION
+    assert ToolRegistrationError("search").suggestion.startswith(
+        "1. Verify 'search' function is properly decorated with @ingest\n"
+    )
+    assert WizelitSDKException("plain").suggestion == ""
+    assert WizelitSDKException("custom", "do this").suggestion == "do this"
+
+
+def test_fields_live_in_slots():
+    error = ToolRegistrationError("search", reason="duplicate")
+
+    assert "search" in str(error)
+    assert (error.tool_name, error.reason) == ("search", "duplicate")
+    assert vars(error) == {}
+
+
+def test_known_identifiers_are_interned():
+    from wizelit_sdk.exceptions import TransportError
+
+    transport = "".join(["streamable", "-http"])
+    error = TransportError(transport, reason="refused")
+
+    assert error.transport_type is TransportError("streamable-http").transport_type
+    assert TransportError("custom").transport_type == "custom"
+
+
+def test_compiled_suggestion_templates_match_str_format():
+    from wizelit_sdk.exceptions import _Attributes, _compile_template
+
+    class Sample:
+        name = "search"
+        seconds = 1.5
+
+    for template in ("'{name}' took {seconds}s, 100% {{literal}}", "no fields", "{seconds:.0f}"):
+        assert _compile_template(template)(Sample()) == template.format_map(_Attributes(Sample()))
+
+
+def test_message_is_read_from_args():
+    error = JobNotFoundError("JOB-1")
+
+    assert isinstance(error, WizelitSDKException)
+    assert error.args == ("Job not found: JOB-1",)
+    assert error.message is error.args[0]
+
+
+def test_message_and_suggestion_can_be_reassigned():
+    error = JobNotFoundError("JOB-1")
+    str(error)
+
+    error.message = "Job JOB-1 expired"
+    error.suggestion = "Start the job again"
+
+    assert error.args == ("Job JOB-1 expired",)
+    assert str(error) == "Job JOB-1 expired\nSuggestion: Start the job again"
+
+
+def test_suggestions_are_rendered_from_the_class_registry():
+    error = ToolRegistrationError("search")
+
+    assert error._suggestion is None
+    assert error.suggestion == ToolRegistrationError.SUGGESTION_TEMPLATE.format(tool_name="search")
@@ -0,0 +1,236 @@
+"""Tests for Job logging, heartbeats and persistence."""
+
+import asyncio
+import contextlib
+from typing import Any, cast
+
+from wizelit_sdk.agent_wrapper.job import DatabaseLogWriter, Job
+from wizelit_sdk.models.job import JobLogModel, JobModel
+
+
+def _job(**kwargs: Any) -> Job:
+    """A Job created outside a tool call (no FastMCP context), e.g. with fakes."""
+    return Job(cast(Any, None), **kwargs)
+
+
+class _RecordingDatabase:
+    def __init__(self):
+        self.sessions = 0
+
+    @contextlib.asynccontextmanager
+    async def get_session(self):
+        self.sessions += 1
+        yield object()
+
+
+def test_database_logs_are_written_in_one_batch(monkeypatch):
+    written = []
+
+    async def fake_bulk_write(session, rows, copy_threshold=None):
+        assert copy_threshold is None
+        written.append(list(rows))
+
+    monkeypatch.setattr(JobLogModel, "bulk_write", fake_bulk_write)
+
+    async def scenario():
+        db: Any = _RecordingDatabase()
+        job = _job(db_manager=db)
+        for i in range(5):
+            job.logger.info(f"line {i}")
+        await DatabaseLogWriter.for_manager(db).flush()
+        return job, db.sessions
+
+    job, sessions = asyncio.run(scenario())
+    assert sessions == 1
+    assert [row["message"] for row in written[0]] == [f"line {i}" for i in range(5)]
+    assert {row["job_id"] for row in written[0]} == {job.id}
+
+
+def test_failed_batch_is_retried_per_job(monkeypatch):
+    written = []
+
+    async def fake_bulk_write(session, rows, copy_threshold=None):
+        if any(row["job_id"] == "JOB-BAD" for row in rows):
+            raise RuntimeError("foreign key violation")
+        written.extend((row["job_id"], row["message"]) for row in rows)
+
+    monkeypatch.setattr(JobLogModel, "bulk_write", fake_bulk_write)
+
+    async def scenario():
+        db: Any = _RecordingDatabase()
+        good = _job(job_id="JOB-GOOD", db_manager=db)
+        bad = _job(job_id="JOB-BAD", db_manager=db)
+        good.logger.info("kept")
+        bad.logger.info("lost")
+        await DatabaseLogWriter.for_manager(db).flush()
+
+    asyncio.run(scenario())
+    assert written == [("JOB-GOOD", "kept")]
+
+
+def test_logs_from_worker_threads_reach_the_database_writer(monkeypatch):
+    written = []
+
+    async def fake_bulk_write(session, rows, copy_threshold=None):
+        written.extend(row["message"] for row in rows)
+
+    monkeypatch.setattr(JobLogModel, "bulk_write", fake_bulk_write)
+
+    async def scenario():
+        db: Any = _RecordingDatabase()
+        job = _job(db_manager=db)
+        await asyncio.to_thread(job.logger.info, "from a sync tool")
+        await asyncio.sleep(0)
+        await DatabaseLogWriter.for_manager(db).flush()
+
+    asyncio.run(scenario())
+    assert written == ["from a sync tool"]
+
+
+def test_memory_logs_keep_only_the_most_recent_lines():
+    job = _job(max_memory_logs=2)
+    for i in range(3):
+        job.logger.info(f"line {i}")
+
+    logs = job.logs
+    assert isinstance(logs, list)
+    assert [line.rsplit(" ", 1)[-1] for line in logs] == ["1", "2"]
+
+
+def test_heartbeat_updates_a_single_memory_line():
+    async def scenario():
+        job = _job()
+        job.logger.info("started")
+        await job.run(asyncio.sleep(0.05), heartbeat_interval=0.01)
+        return job.logs
+
+    logs = asyncio.run(scenario())
+    assert len(logs) == 2
+    assert logs[0].endswith("started")
+    assert "Still working" in logs[1]
+
+
+def test_running_jobs_share_one_heartbeat_round_trip():
+    beats = []
+
+    class _Streamer:
+        def enqueue_log(self, job_id, message, level):
+            pass
+
+        async def publish_status_change(self, job_id, status, result=None, error=None):
+            pass
+
+        async def publish_heartbeats(self, heartbeats):
+            beats.append(sorted(heartbeats))
+
+    async def scenario():
+        streamer = _Streamer()
+        jobs = [_job(log_streamer=streamer) for _ in range(3)]
+        await asyncio.gather(
+            *(job.run(asyncio.sleep(0.05), heartbeat_interval=0.01) for job in jobs)
+        )
+        return sorted(job.id for job in jobs)
+
+    ids = asyncio.run(scenario())
+    assert beats[0] == ids
+
+
+def test_failing_heartbeat_does_not_stop_other_jobs(monkeypatch):
+    beats = []
+
+    class _Streamer:
+        def enqueue_log(self, job_id, message, level):
+            pass
+
+        async def publish_status_change(self, job_id, status, result=None, error=None):
+            pass
+
+        async def publish_heartbeats(self, heartbeats):
+            beats.extend(heartbeats)
+
+    def broken_heartbeat():
+        raise RuntimeError("broken")
+
+    async def scenario():
+        streamer = _Streamer()
+        bad, good = _job(log_streamer=streamer), _job(log_streamer=streamer)
+        monkeypatch.setattr(bad, "_record_heartbeat", broken_heartbeat)
+        await asyncio.gather(
+            *(job.run(asyncio.sleep(0.05), heartbeat_interval=0.01) for job in (bad, good))
+        )
+        return bad.id, good.id
+
+    bad_id, good_id = asyncio.run(scenario())
+    assert good_id in beats and bad_id not in beats
+
+
+def test_persist_to_db_issues_a_single_upsert(monkeypatch):
+    upserts = []
+
+    async def fake_bulk_upsert(session, rows):
+        upserts.append(rows)
+
+    monkeypatch.setattr(JobModel, "bulk_upsert", fake_bulk_upsert)
+
+    async def scenario():
+        db: Any = _RecordingDatabase()
+        job = _job(db_manager=db)
+        job.result = "done"
+        await job.persist_to_db()
+        # Unchanged state is not written again
+        await job.persist_to_db()
+        return job, db.sessions
+
+    job, sessions = asyncio.run(scenario())
+    assert sessions == 1
+    assert upserts == [
+        [{"id": job.id, "status": "running", "result": "done", "error": None}]
+    ]
+
+
+def test_one_record_reaches_memory_database_and_stream(monkeypatch):
+    written = []
+    streamed = []
+
+    async def fake_bulk_write(session, rows, copy_threshold=None):
+        written.extend((row["job_id"], row["message"], row["level"]) for row in rows)
+
+    class _Streamer:
+        def enqueue_log(self, job_id, message, level):
+            streamed.append((job_id, message, level))
+
+    monkeypatch.setattr(JobLogModel, "bulk_write", fake_bulk_write)
+
+    async def scenario():
+        db: Any = _RecordingDatabase()
+        job = _job(db_manager=db, log_streamer=_Streamer())
+        job.logger.warning("careful")
+        await DatabaseLogWriter.for_manager(db).flush()
+        return job
+
+    job = asyncio.run(scenario())
+    assert len(job.logger.handlers) == 1
+    assert job.logs[0].startswith("[WARNING] [") and job.logs[0].endswith("careful")
+    assert written == [(job.id, "careful", "WARNING")]
+    assert streamed == [(job.id, "careful", "WARNING")]
+
+
+def test_status_change_is_published_only_when_status_changes():
+    published = []
+
+    class _Streamer:
+        def enqueue_log(self, job_id, message, level):
+            pass
+
+        async def publish_status_change(self, job_id, status, result=None, error=None):
+            published.append(status)
+
+    async def scenario():
+        job = _job(log_streamer=_Streamer())
+        job.status = "running"
+        job.status = "completed"
+        job.status = "completed"
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+    assert published == ["completed"]
@@ -0,0 +1,29 @@
+"""Tests for the shared model helpers."""
+
+import time
+
+from wizelit_sdk.models.base import _uuid7
+from wizelit_sdk.models.job import JobModel
+
+
+def test_uuid7_is_versioned_and_time_ordered():
+    first = _uuid7()
+    time.sleep(0.002)
+    second = _uuid7()
+
+    assert (first.version, first.variant) == (7, "specified in RFC 4122")
+    assert first < second
+    assert abs((first.int >> 80) - time.time_ns() // 1_000_000) < 1_000
+
+
+def test_to_dict_reads_every_column():
+    job = JobModel(id="JOB-1", status="running", result={"ok": True})
+
+    assert job.to_dict() == {
+        "id": "JOB-1",
+        "status": "running",
+        "result": {"ok": True},
+        "error": None,
+        "created_at": None,
+        "updated_at": None,
+    }
@@ -0,0 +1,35 @@
+"""Import-time behaviour of the top-level wizelit_sdk package."""
+
+import subprocess
+import sys
+
+
+def test_top_level_import_defers_heavy_dependencies():
+    """Importing wizelit_sdk alone must not pull in SQLAlchemy, fastmcp or redis."""
+    code = (
+        "import sys, wizelit_sdk; "
+        "print(sorted(m for m in ('sqlalchemy', 'fastmcp', 'redis') if m in sys.modules))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "[]"
+
+
+def test_lazy_attributes_resolve_to_submodule_objects():
+    """Public names still resolve to the same objects as the defining modules."""
+    import wizelit_sdk
+    from wizelit_sdk.agent_wrapper import WizelitAgent
+    from wizelit_sdk.models.job import JobStatus
+
+    assert wizelit_sdk.WizelitAgent is WizelitAgent
+    assert wizelit_sdk.JobStatus is JobStatus
+    assert set(wizelit_sdk.__all__) <= set(dir(wizelit_sdk))
+
+
+def test_models_package_registers_every_table():
+    """Importing wizelit_sdk.models puts all tables on BaseModel.metadata (e.g. for Alembic)."""
+    code = (
+        "from wizelit_sdk.models import BaseModel; "
+        "print(sorted(BaseModel.metadata.tables))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "['job_logs', 'jobs']"
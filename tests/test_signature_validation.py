@@ -0,0 +1,103 @@
+"""Tests for argument binding and validation helpers."""
+
+from typing import Optional
+
+import pytest
+
+from wizelit_sdk.agent_wrapper.signature_validation import (
+    ArgumentBinder,
+    SignatureValidationError,
+    bind_and_validate_arguments,
+)
+
+
+def _tool(code: str, retries: int = 3, label: Optional[str] = None, job=None) -> str:
+    return code
+
+
+def test_binder_applies_defaults_and_skips_excluded_params():
+    binder = ArgumentBinder(_tool, exclude_params=["job"])
+
+    assert binder.bind(("x",), {}) == {"code": "x", "retries": 3, "label": None}
+    assert binder.bind((), {"code": "x", "retries": 5}) == {
+        "code": "x",
+        "retries": 5,
+        "label": None,
+    }
+
+
+def test_binder_rejects_missing_and_unknown_arguments():
+    binder = ArgumentBinder(_tool, exclude_params=["job"])
+
+    with pytest.raises(SignatureValidationError):
+        binder.bind((), {})
+    with pytest.raises(SignatureValidationError):
+        binder.bind(("x",), {"unknown": 1})
+    with pytest.raises(SignatureValidationError):
+        binder.bind(("x",), {"job": object()})
+
+
+def test_binder_rejects_wrong_types():
+    binder = ArgumentBinder(_tool, exclude_params=["job"])
+
+    with pytest.raises(SignatureValidationError, match="retries"):
+        binder.bind(("x",), {"retries": "many"})
+
+
+def test_bind_and_validate_arguments_matches_binder():
+    assert bind_and_validate_arguments(
+        _tool, ("x",), {"label": "l"}, exclude_params=["job"]
+    ) == {"code": "x", "retries": 3, "label": "l"}
+
+
+def test_binder_falls_back_for_variadic_signatures():
+    def variadic(*names, sep: str = ",") -> str:
+        return sep.join(names)
+
+    binder = ArgumentBinder(variadic)
+
+    assert binder.bind(("a", "b"), {}) == {"names": ("a", "b"), "sep": ","}
+    with pytest.raises(SignatureValidationError):
+        binder.bind(("a",), {"other": 1})
+
+
+def test_bind_and_validate_arguments_reuses_binder():
+    from wizelit_sdk.agent_wrapper.signature_validation import _cached_binder
+
+    bind_and_validate_arguments(_tool, ("x",), {}, exclude_params=["job"])
+    hits = _cached_binder.cache_info().hits
+    bind_and_validate_arguments(_tool, ("y",), {}, exclude_params=("job",))
+
+    assert _cached_binder.cache_info().hits == hits + 1
+
+
+def test_compiled_checks_match_typeguard_semantics():
+    from typing import Any, List
+
+    def numbers(ratio: float, items: List[int], anything: Any, flag: Optional[int] = None) -> None:
+        return None
+
+    binder = ArgumentBinder(numbers)
+
+    assert binder.bind((1, [1, 2], object()), {})["ratio"] == 1
+    assert binder.bind((0.5, [], None), {"flag": True})["flag"] is True
+    with pytest.raises(SignatureValidationError, match="items"):
+        binder.bind((0.5, ["x"], None), {})
+    with pytest.raises(SignatureValidationError, match="flag"):
+        binder.bind((0.5, [], None), {"flag": 1.5})
+
+
+def test_ensure_type_hints_resolves_hints_once(monkeypatch):
+    from wizelit_sdk.agent_wrapper import signature_validation
+
+    def tool(code: str, job=None) -> str:
+        return code
+
+    hints = signature_validation.ensure_type_hints(tool, exclude_params=["job"])
+    assert hints == {"code": str, "return": str}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("hints resolved again")
+
+    monkeypatch.setattr(signature_validation, "get_type_hints", fail)
+    assert ArgumentBinder(tool, exclude_params=["job"]).bind(("x",), {}) == {"code": "x"}
@@ -0,0 +1,374 @@
+"""Tests for LogStreamer publishing behaviour (uses an in-memory Redis stand-in)."""
+
+import asyncio
+import json
+from typing import Any, Callable
+
+from wizelit_sdk.agent_wrapper import streaming
+from wizelit_sdk.agent_wrapper.streaming import LogStreamer
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def publish(self, channel, payload):
+        self._commands.append(("publish", channel, payload))
+        return self
+
+    def set(self, key, value, ex=None):
+        self._commands.append(("set", key, (str(value), ex)))
+        return self
+
+    def eval(self, script, numkeys, state_key, channel, payload, ttl):
+        assert numkeys == 2
+        self._commands.append(("set", state_key, (payload, ttl)))
+        self._commands.append(("publish", channel, payload))
+        return self
+
+    async def execute(self):
+        self._client.round_trips += 1
+        for command, target, value in self._commands:
+            if command == "publish":
+                self._client.published.append((target, value))
+            else:
+                self._client.values[target] = value
+        self._commands = []
+
+
+class _FakePubSub:
+    def __init__(self, messages):
+        self._messages = list(messages)
+        self.subscribed = ()
+        self.closed = False
+
+    async def subscribe(self, *channels):
+        self.subscribed = channels
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        if self._messages:
+            return self._messages.pop(0)
+        await asyncio.sleep(timeout or 0)
+        return None
+
+    async def unsubscribe(self):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.published = []
+        self.round_trips = 0
+        self.values = {}
+        self.closed = False
+        self.connection_pool: Any = None
+        self.pubsub: Callable[..., _FakePubSub] = lambda **kwargs: _FakePubSub([])
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = (str(value), ex)
+
+    async def get(self, key):
+        value = self.values.get(key)
+        return value[0] if value else None
+
+    async def ping(self):
+        await asyncio.sleep(0)
+        return True
+
+    async def close(self):
+        self.closed = True
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def publish(self, channel, payload):
+        self.round_trips += 1
+        self.published.append((channel, payload))
+
+
+def _streamer(**kwargs) -> LogStreamer:
+    streamer = LogStreamer(**kwargs)
+    streamer._redis = _FakeRedis()
+    return streamer
+
+
+def _fake(streamer: LogStreamer) -> _FakeRedis:
+    client = streamer._redis
+    assert isinstance(client, _FakeRedis)
+    return client
+
+
+def test_logs_are_published_in_batches():
+    async def scenario():
+        streamer = _streamer(batch_size=3, flush_ms=1000)
+        for i in range(7):
+            await streamer.publish_log("JOB-1", f"line {i}")
+        fake = _fake(streamer)
+        assert len(fake.published) == 6
+        assert fake.round_trips == 2
+
+        await streamer.flush()
+        assert [json.loads(p)["message"] for _, p in fake.published] == [
+            f"line {i}" for i in range(7)
+        ]
+        assert fake.round_trips == 3
+
+    asyncio.run(scenario())
+
+
+def test_partial_batch_is_flushed_after_delay():
+    async def scenario():
+        streamer = _streamer(batch_size=100, flush_ms=1)
+        await streamer.publish_log("JOB-1", "only line")
+        assert _fake(streamer).published == []
+        await asyncio.sleep(0.05)
+        assert [c for c, _ in _fake(streamer).published] == [streaming._log_channel("JOB-1")]
+
+    asyncio.run(scenario())
+
+
+def test_status_change_is_published_after_buffered_logs():
+    async def scenario():
+        streamer = _streamer(batch_size=100, flush_ms=1000)
+        await streamer.publish_log("JOB-1", "last line")
+        await streamer.publish_status_change("JOB-1", "completed", result="ok")
+        channels = [c for c, _ in _fake(streamer).published]
+        assert channels == [streaming._log_channel("JOB-1"), "job:JOB-1:status"]
+        assert _fake(streamer).round_trips == 1
+
+        state = await streamer.get_job_state("JOB-1")
+        assert state is not None
+        assert (state["status"], state["result"]) == ("completed", "ok")
+        assert _fake(streamer).values["job:JOB-1:state"][1] == LogStreamer.STATE_TTL_SECONDS
+
+    asyncio.run(scenario())
+
+
+def test_full_buffer_drops_oldest_log_events():
+    async def scenario():
+        streamer = _streamer(batch_size=100, flush_ms=1000, max_pending=3)
+        for i in range(5):
+            await streamer.publish_log("JOB-1", f"line {i}")
+        await streamer.flush()
+        return [json.loads(p)["message"] for _, p in _fake(streamer).published]
+
+    assert asyncio.run(scenario()) == ["line 2", "line 3", "line 4"]
+
+
+def test_status_change_does_not_take_a_log_buffer_slot():
+    async def scenario():
+        streamer = _streamer(batch_size=100, flush_ms=1000, max_pending=2)
+        await streamer.publish_log("JOB-1", "line 0")
+        await streamer.publish_log("JOB-1", "line 1")
+        await streamer.publish_status_change("JOB-1", "completed")
+        assert streamer._dropped == 0
+        return [json.loads(p).get("message", "status") for _, p in _fake(streamer).published]
+
+    assert asyncio.run(scenario()) == ["line 0", "line 1", "status"]
+
+
+def test_enqueued_logs_are_flushed_by_a_background_task():
+    async def scenario():
+        streamer = _streamer(batch_size=3, flush_ms=1000)
+        for i in range(4):
+            streamer.enqueue_log("JOB-1", f"line {i}")
+        await asyncio.sleep(0.01)
+        return _fake(streamer)
+
+    fake = asyncio.run(scenario())
+    # The full batch schedules one immediate flush that also picks up line 3
+    assert [json.loads(p)["message"] for _, p in fake.published] == [
+        f"line {i}" for i in range(4)
+    ]
+    assert fake.round_trips == 1
+
+
+def test_heartbeat_is_a_key_not_a_log_event():
+    async def scenario():
+        streamer = _streamer()
+        await streamer.publish_heartbeat("JOB-1", 15)
+        assert _fake(streamer).published == []
+        assert _fake(streamer).values["job:JOB-1:heartbeat"] == ("15", 30)
+        return await streamer.get_heartbeat("JOB-1")
+
+    assert asyncio.run(scenario()) == 15
+
+
+def test_heartbeats_for_many_jobs_share_one_round_trip():
+    async def scenario():
+        streamer = _streamer()
+        await streamer.publish_heartbeats({"JOB-1": 5, "JOB-2": 10})
+        return _fake(streamer)
+
+    fake = asyncio.run(scenario())
+    assert fake.round_trips == 1
+    assert fake.values == {
+        "job:JOB-1:heartbeat": ("5", 30),
+        "job:JOB-2:heartbeat": ("10", 30),
+    }
+
+
+def test_streamers_share_one_client_per_url(monkeypatch):
+    created = []
+
+    class _Pool:
+        async def disconnect(self):
+            pass
+
+    def fake_from_url(url, **kwargs):
+        client = _FakeRedis()
+        client.connection_pool = _Pool()
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(streaming.redis, "from_url", fake_from_url)
+
+    async def scenario():
+        first = LogStreamer("redis://shared")
+        second = LogStreamer("redis://shared")
+        await first.connect()
+        await second.connect()
+        assert len(created) == 1
+
+        await first.close()
+        assert not created[0].closed
+        await second.close()
+        assert created[0].closed
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_connects_take_one_shared_client_reference(monkeypatch):
+    created = []
+
+    class _Pool:
+        async def disconnect(self):
+            pass
+
+    def fake_from_url(url, **kwargs):
+        client = _FakeRedis()
+        client.connection_pool = _Pool()
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(streaming.redis, "from_url", fake_from_url)
+
+    async def scenario():
+        streamer = LogStreamer("redis://concurrent")
+        await asyncio.gather(streamer.connect(), streamer.publish_heartbeat("JOB-1", 1))
+        await streamer.close()
+
+    asyncio.run(scenario())
+    assert len(created) == 1
+    assert created[0].closed
+
+
+def test_shared_client_serves_more_subscribers_than_a_capped_pool(monkeypatch):
+    class _Pool:
+        def __init__(self, max_connections=None):
+            self.max_connections = max_connections
+            self.in_use = 0
+
+        def take(self):
+            if self.max_connections is not None and self.in_use >= self.max_connections:
+                raise ConnectionError("Too many connections")
+            self.in_use += 1
+
+        async def disconnect(self):
+            pass
+
+    def fake_from_url(url, **kwargs):
+        client = _FakeRedis()
+        pool = client.connection_pool = _Pool(kwargs.get("max_connections"))
+
+        def pubsub(**kwargs):
+            # A subscription holds its connection for its whole life
+            pool.take()
+            return _FakePubSub([])
+
+        client.pubsub = pubsub
+        return client
+
+    monkeypatch.setattr(streaming.redis, "from_url", fake_from_url)
+
+    async def subscribe(streamer, job_id):
+        return [event async for event in streamer.subscribe_logs(job_id, timeout=0.05)]
+
+    async def scenario():
+        streamers = [LogStreamer("redis://busy") for _ in range(65)]
+        await asyncio.gather(
+            *(subscribe(streamer, f"JOB-{i}") for i, streamer in enumerate(streamers))
+        )
+        await asyncio.gather(*(streamer.close() for streamer in streamers))
+
+    asyncio.run(scenario())
+
+
+def test_spliced_json_log_event_matches_json_dumps():
+    from datetime import datetime, timezone
+
+    timestamp = datetime.now(timezone.utc)
+    message = 'quote " backslash \\ unicode é newline \n'
+
+    assert streaming._splice_json_log_event("JOB-1", message, "INFO", timestamp) == json.dumps(
+        {
+            "job_id": "JOB-1",
+            "message": message,
+            "level": "INFO",
+            "timestamp": timestamp.isoformat(),
+        }
+    )
+
+
+def _message(channel, event):
+    return {"type": "message", "channel": channel, "data": json.dumps(event)}
+
+
+def test_log_channels_are_sharded_by_job_id():
+    channels = {streaming._log_channel(f"JOB-{i}") for i in range(200)}
+
+    assert channels == {f"wizelit:logs:{n}" for n in range(streaming.LOG_CHANNEL_SHARDS)}
+    assert streaming._log_channel("JOB-1") == streaming._log_channel("JOB-1")
+
+
+def test_subscribe_logs_stops_at_final_status():
+    logs = streaming._log_channel("JOB-1")
+    events = [
+        _message(logs, {"job_id": "JOB-1", "message": "working"}),
+        _message(logs, {"job_id": "JOB-2", "message": "other job"}),
+        None,
+        _message("job:JOB-1:status", {"job_id": "JOB-1", "status": "completed"}),
+        _message(logs, {"job_id": "JOB-1", "message": "never read"}),
+    ]
+    pubsub = _FakePubSub(events)
+
+    async def scenario():
+        streamer = _streamer()
+        _fake(streamer).pubsub = lambda **kwargs: pubsub
+        return [event async for event in streamer.subscribe_logs("JOB-1")]
+
+    assert asyncio.run(scenario()) == [
+        {"job_id": "JOB-1", "message": "working"},
+        {"job_id": "JOB-1", "status": "completed"},
+    ]
+    assert pubsub.subscribed == (logs, "job:JOB-1:status")
+    assert pubsub.closed
+
+
+def test_subscribe_logs_times_out_while_idle():
+    async def scenario():
+        streamer = _streamer()
+        _fake(streamer).pubsub = lambda **kwargs: _FakePubSub([])
+        return [event async for event in streamer.subscribe_logs("JOB-1", timeout=0.05)]
+
+    assert asyncio.run(scenario()) == []